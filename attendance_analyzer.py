@@ -17,8 +17,12 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import warnings
+import importlib.util
 warnings.filterwarnings('ignore')
 
+# Optional Rust-based Excel reader (pandas engine='calamine')
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+
 
 def load_attendance_file(file_path: str) -> pd.DataFrame:
     """
@@ -38,8 +42,10 @@ def load_attendance_file(file_path: str) -> pd.DataFrame:
     Raises:
         ValueError: If required columns are missing
     """
-    # Read Excel file - header is at row 3 (0-indexed = 2)
-    df = pd.read_excel(file_path, header=2)
+    # Read Excel file - header is at row 3 (0-indexed = 2); calamine parses
+    # the workbook natively when installed, otherwise pandas' default engine
+    engine = 'calamine' if CALAMINE_AVAILABLE else None
+    df = pd.read_excel(file_path, header=2, engine=engine)
     
     # Clean column names (remove whitespace)
     df.columns = df.columns.str.strip()
@@ -162,28 +168,34 @@ def calculate_overtime_hours(df: pd.DataFrame) -> pd.DataFrame:
     # Calculate overtime for each employee
     overtime_results = []
     
+    # One groupby pass splits the rows per employee (and per date below),
+    # instead of rescanning the whole frame with a boolean mask for each one.
+    # A missing name matches no rows, so it still gets an empty summary row
+    employee_groups = dict(list(overtime_df.groupby('Name', sort=False)))
+    no_records = overtime_df.iloc[:0]
+    
     for name in overtime_df['Name'].unique():
-        employee_ot = overtime_df[overtime_df['Name'] == name].copy()
+        employee_ot = employee_groups.get(name, no_records)
         
         total_hours = 0.0
         session_count = 0
         
         # Process each date separately
-        for date in employee_ot['Date'].unique():
-            date_records = employee_ot[employee_ot['Date'] == date].reset_index(drop=True)
+        for date, date_records in employee_ot.groupby('Date', sort=False):
+            date_records = date_records.reset_index(drop=True)
             
             # Find paired In/Out entries
             i = 0
             while i < len(date_records):
                 # Look for an "In" entry
-                if date_records.loc[i, 'IsOvertimeIn'] and not date_records.loc[i, 'IsOvertimeOut']:
-                    in_time = date_records.loc[i, 'DateTime']
+                if date_records.at[i, 'IsOvertimeIn'] and not date_records.at[i, 'IsOvertimeOut']:
+                    in_time = date_records.at[i, 'DateTime']
                     
                     # Look for the next "Out" entry
                     j = i + 1
                     while j < len(date_records):
-                        if date_records.loc[j, 'IsOvertimeOut'] and not date_records.loc[j, 'IsOvertimeIn']:
-                            out_time = date_records.loc[j, 'DateTime']
+                        if date_records.at[j, 'IsOvertimeOut'] and not date_records.at[j, 'IsOvertimeIn']:
+                            out_time = date_records.at[j, 'DateTime']
                             
                             # Validate: Out time must be after In time
                             if out_time > in_time:
@@ -426,13 +438,13 @@ def get_employee_details(df: pd.DataFrame, employee_name: str) -> Dict:
             
             i = 0
             while i < len(date_records):
-                if date_records.loc[i, 'IsOvertimeIn'] and not date_records.loc[i, 'IsOvertimeOut']:
-                    in_time = date_records.loc[i, 'DateTime']
+                if date_records.at[i, 'IsOvertimeIn'] and not date_records.at[i, 'IsOvertimeOut']:
+                    in_time = date_records.at[i, 'DateTime']
                     
                     j = i + 1
                     while j < len(date_records):
-                        if date_records.loc[j, 'IsOvertimeOut'] and not date_records.loc[j, 'IsOvertimeIn']:
-                            out_time = date_records.loc[j, 'DateTime']
+                        if date_records.at[j, 'IsOvertimeOut'] and not date_records.at[j, 'IsOvertimeIn']:
+                            out_time = date_records.at[j, 'DateTime']
                             
                             if out_time > in_time:
                                 duration = (out_time - in_time).total_seconds() / 3600.0
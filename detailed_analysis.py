@@ -16,12 +16,21 @@ print("=" * 100)
 # Parse date and time from Date/Time column
 df[['Date', 'Time']] = df['Date/Time'].astype(str).str.split(' ', n=1, expand=True)
 df['Date_parsed'] = pd.to_datetime(df['Date'], format='%d/%m/%Y', errors='coerce')
-df['Time_parsed'] = pd.to_datetime(df['Time'], format='%H:%M:%S', errors='coerce').dt.time
+time_dt = pd.to_datetime(df['Time'], format='%H:%M:%S', errors='coerce')
+df['Time_parsed'] = time_dt.dt.time
+# Decimal hour of day (NaN when unparsed), used by the shift filters below
+df['Time_decimal'] = time_dt.dt.hour + time_dt.dt.minute / 60
+
+# Status masks built once; counts are mask sums (no filtered frame copies)
+is_checkin = df['Status'] == 'C/In'
+is_checkout = df['Status'] == 'C/Out'
+total_checkins = int(is_checkin.sum())
+total_checkouts = int(is_checkout.sum())
 
 print(f"\n📊 Total records: {len(df)}")
-print(f"📊 Total check-ins: {len(df[df['Status'] == 'C/In'])}")
-print(f"📊 Total check-outs: {len(df[df['Status'] == 'C/Out'])}")
-print(f"📊 Difference: {len(df[df['Status'] == 'C/In']) - len(df[df['Status'] == 'C/Out'])} (should be close to 0)")
+print(f"📊 Total check-ins: {total_checkins}")
+print(f"📊 Total check-outs: {total_checkouts}")
+print(f"📊 Difference: {total_checkins - total_checkouts} (should be close to 0)")
 
 # Check for morning checkouts
 print("\n" + "=" * 100)
@@ -29,16 +38,16 @@ print("MORNING CHECKOUTS (before 12:00 PM) - Potential night shift endings:")
 print("=" * 100)
 
 morning_checkouts = df[
-    (df['Status'] == 'C/Out') & 
+    is_checkout & 
     (df['Time_parsed'].notna()) &
-    (df['Time_parsed'].apply(lambda x: x.hour < 12))
+    (df['Time_decimal'] < 12)
 ]
 
 if len(morning_checkouts) > 0:
     print(f"\n⚠️  Found {len(morning_checkouts)} morning checkouts")
     print("\nSample records:")
-    for idx, row in morning_checkouts.head(10).iterrows():
-        print(f"  {row['Name']:30s} | {row['Date']:12s} | {row['Time']:10s} | {row['Status']}")
+    for name, date, time_val, status in morning_checkouts.head(10)[['Name', 'Date', 'Time', 'Status']].itertuples(index=False, name=None):
+        print(f"  {name:30s} | {date:12s} | {time_val:10s} | {status}")
 else:
     print("✅ No morning checkouts found")
 
@@ -48,16 +57,16 @@ print("NIGHT SHIFT CHECK-INS (after 16:10):")
 print("=" * 100)
 
 night_checkins = df[
-    (df['Status'] == 'C/In') & 
+    is_checkin & 
     (df['Time_parsed'].notna()) &
-    (df['Time_parsed'].apply(lambda x: (x.hour + x.minute/60) >= 16.1667))
+    (df['Time_decimal'] >= 16.1667)
 ]
 
 if len(night_checkins) > 0:
     print(f"\n🌙 Found {len(night_checkins)} night shift check-ins")
     print("\nSample records:")
-    for idx, row in night_checkins.head(10).iterrows():
-        print(f"  {row['Name']:30s} | {row['Date']:12s} | {row['Time']:10s} | {row['Status']}")
+    for name, date, time_val, status in night_checkins.head(10)[['Name', 'Date', 'Time', 'Status']].itertuples(index=False, name=None):
+        print(f"  {name:30s} | {date:12s} | {time_val:10s} | {status}")
 else:
     print("✅ No night shift check-ins found")
 
@@ -66,39 +75,41 @@ print("\n" + "=" * 100)
 print("EMPLOYEE-LEVEL PAIRING ANALYSIS:")
 print("=" * 100)
 
+# Row positions per employee, computed once instead of a Name mask per employee
+name_rows = df.groupby('Name', sort=False).indices
+
 for employee in df['Name'].unique()[:5]:  # Check first 5 employees
-    emp_data = df[df['Name'] == employee].sort_values('Date_parsed')
+    emp_data = df.take(name_rows.get(employee, [])).sort_values('Date_parsed')
+    emp_ins = is_checkin.loc[emp_data.index]
+    emp_outs = is_checkout.loc[emp_data.index]
+    total_ins = int(emp_ins.sum())
+    total_outs = int(emp_outs.sum())
     
     print(f"\n📋 {employee}")
     print(f"   Total records: {len(emp_data)}")
-    print(f"   Check-ins: {len(emp_data[emp_data['Status'] == 'C/In'])}")
-    print(f"   Check-outs: {len(emp_data[emp_data['Status'] == 'C/Out'])}")
+    print(f"   Check-ins: {total_ins}")
+    print(f"   Check-outs: {total_outs}")
     
     # Show all records
     print("\n   All records:")
-    for idx, row in emp_data.iterrows():
-        date_str = row['Date_parsed'].strftime('%d/%m/%Y') if pd.notna(row['Date_parsed']) else 'N/A'
-        time_obj = row['Time_parsed']
+    for date_parsed, time_obj, status in emp_data[['Date_parsed', 'Time_parsed', 'Status']].itertuples(index=False, name=None):
+        date_str = date_parsed.strftime('%d/%m/%Y') if pd.notna(date_parsed) else 'N/A'
         time_str = f"{time_obj.hour:02d}:{time_obj.minute:02d}:{time_obj.second:02d}" if time_obj else 'N/A'
-        print(f"     {date_str} {time_str:10s} | {row['Status']:6s}")
+        print(f"     {date_str} {time_str:10s} | {status:6s}")
     
     # Check for potential issues
     issues = []
     
     # Check for dates with multiple check-ins or check-outs
-    daily_groups = emp_data.groupby('Date_parsed')
-    for date, group in daily_groups:
-        checkins = len(group[group['Status'] == 'C/In'])
-        checkouts = len(group[group['Status'] == 'C/Out'])
-        
+    # Per-day check-in/check-out counts in one grouped sum
+    daily_counts = pd.DataFrame({'ins': emp_ins, 'outs': emp_outs}).groupby(emp_data['Date_parsed']).sum()
+    for date, checkins, checkouts in daily_counts.itertuples(name=None):
         if checkins > 1:
             issues.append(f"Multiple check-ins ({checkins}) on {date.strftime('%d/%m/%Y')}")
         if checkouts > 1:
             issues.append(f"Multiple check-outs ({checkouts}) on {date.strftime('%d/%m/%Y')}")
     
     # Check for unpaired check-ins/outs
-    total_ins = len(emp_data[emp_data['Status'] == 'C/In'])
-    total_outs = len(emp_data[emp_data['Status'] == 'C/Out'])
     if total_ins != total_outs:
         issues.append(f"Unmatched count: {total_ins} check-ins vs {total_outs} check-outs")
     
@@ -115,8 +126,8 @@ print("=" * 100)
 print(f"✅ Total records: {len(df)}")
 print(f"✅ Employees: {df['Name'].nunique()}")
 print(f"✅ Date range: {df['Date_parsed'].min().strftime('%d/%m/%Y')} to {df['Date_parsed'].max().strftime('%d/%m/%Y')}")
-print(f"✅ Check-ins: {len(df[df['Status'] == 'C/In'])}")
-print(f"✅ Check-outs: {len(df[df['Status'] == 'C/Out'])}")
+print(f"✅ Check-ins: {total_checkins}")
+print(f"✅ Check-outs: {total_checkouts}")
 print(f"✅ Morning checkouts: {len(morning_checkouts)}")
 print(f"✅ Night shift check-ins: {len(night_checkins)}")
 
@@ -102,13 +102,16 @@ def test_datas_file():
         if 'Time' in df.columns and 'Status' in df.columns:
             try:
                 df_temp = df.copy()
-                df_temp['Time_parsed'] = pd.to_datetime(df_temp['Time'], format='%H:%M:%S', errors='coerce').dt.time
+                time_dt = pd.to_datetime(df_temp['Time'], format='%H:%M:%S', errors='coerce')
+                df_temp['Time_parsed'] = time_dt.dt.time
+                # Decimal hour of day (NaN when unparsed), used by the shift filters below
+                df_temp['Time_decimal'] = time_dt.dt.hour + time_dt.dt.minute / 60
                 
                 # Find checkouts before 12:00 PM
                 morning_checkouts = df_temp[
                     (df_temp['Status'].str.contains('Out', case=False, na=False)) & 
                     (df_temp['Time_parsed'].notna()) &
-                    (df_temp['Time_parsed'].apply(lambda x: x.hour < 12 if pd.notna(x) else False))
+                    (df_temp['Time_decimal'] < 12)
                 ]
                 
                 if len(morning_checkouts) > 0:
@@ -124,7 +127,7 @@ def test_datas_file():
                 night_checkins = df_temp[
                     (df_temp['Status'].str.contains('In', case=False, na=False)) & 
                     (df_temp['Time_parsed'].notna()) &
-                    (df_temp['Time_parsed'].apply(lambda x: (x.hour + x.minute/60) >= 16.1667 if pd.notna(x) else False))
+                    (df_temp['Time_decimal'] >= 16.1667)
                 ]
                 
                 if len(night_checkins) > 0:
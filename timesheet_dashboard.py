@@ -17,6 +17,8 @@ Created: December 2025
 """
 
 import base64
+import hashlib
+import importlib.util
 import io
 import json
 import os
@@ -27,16 +29,17 @@ import tempfile
 import threading
 import time as time_module
 import unittest
+import uuid
 from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-from plotly.subplots import make_subplots
+
+# Heavy optional modules (plotly, openpyxl, psutil) are imported lazily at
+# first use so cold starts and worker spawns don't pay for them up front.
 
 # Import OT Consolidator module
 try:
@@ -53,20 +56,27 @@ try:
 except ImportError:
     OT_MODULE_AVAILABLE = False
 
-# Try to import testing dependencies
-try:
-    import psutil
+# Detect testing dependencies without importing them
+PSUTIL_AVAILABLE = importlib.util.find_spec("psutil") is not None
+MEMORY_PROFILER_AVAILABLE = importlib.util.find_spec("memory_profiler") is not None
 
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+# Optional faster CSV ingest (Arrow-backed columns)
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
-try:
-    from memory_profiler import profile  # type: ignore
+# Optional Rust-based .xlsx/.xls reader (pandas engine="calamine")
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
 
-    MEMORY_PROFILER_AVAILABLE = True
-except ImportError:
-    MEMORY_PROFILER_AVAILABLE = False
+# Optional streaming .xlsx writer for plain (unstyled) exports
+XLSXWRITER_AVAILABLE = importlib.util.find_spec("xlsxwriter") is not None
+
+# Copy-on-Write lets filtered/derived frames share buffers until written,
+# so the pipeline doesn't need defensive .copy() calls (always on in pandas 3)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Entries kept per st.cache_data helper that holds per-dataset results, so a
+# long-running server keeps only the most recent datasets instead of every one
+CACHE_MAX_ENTRIES = 8
 
 # Page Configuration
 st.set_page_config(
@@ -113,12 +123,6 @@ st.markdown(
         font-weight: bold;
         font-style: normal;
     }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #1f77b4;
-    }
     .success-box {
         background-color: #d4edda;
         color: #155724;
@@ -149,6 +153,29 @@ st.markdown(
 class TimesheetProcessor:
     """Core business logic for timesheet processing"""
 
+    # Inline Date/Time formats, tried in order before falling back to inference
+    INLINE_DATETIME_FORMATS = [
+        "%d/%m/%Y %H:%M:%S",  # 01/08/2025 06:43:19
+        "%m/%d/%Y %H:%M:%S",  # 08/01/2025 06:43:19
+        "%d-%b-%y %H:%M:%S",  # 19-Apr-25 7:40:09
+        "%d-%b-%Y %H:%M:%S",  # 19-Apr-2025 7:40:09
+    ]
+
+    # Shift/overtime boundaries as seconds since midnight
+    NIGHT_SHIFT_START_SEC = 15 * 3600 + 50 * 60  # 15:50 (3:50 PM)
+    DAY_WORK_START_SEC = 8 * 3600  # 08:00 AM
+    NIGHT_WORK_START_SEC = 18 * 3600  # 18:00 PM
+    DAY_OVERTIME_START_SEC = 17 * 3600  # 17:00 PM
+    NIGHT_OVERTIME_START_SEC = 3 * 3600  # 03:00 AM
+    NIGHT_CHECKOUT_CUTOFF_SEC = 12 * 3600  # Checkouts up to noon cross midnight
+    MIN_OVERTIME_SEC = 30 * 60  # 30 minutes
+    DAY_MAX_OVERTIME_SEC = 90 * 60  # 1.5 hours
+    NIGHT_MAX_OVERTIME_SEC = 3 * 3600  # 3 hours
+
+    # Workbooks above this size are streamed through openpyxl in row chunks
+    LARGE_EXCEL_BYTES = 20_000_000
+    EXCEL_CHUNK_ROWS = 50_000
+
     def __init__(self):
         self.BASE_FOLDER = "/home/luckdus/Desktop/Data Cleaner"
 
@@ -172,6 +199,34 @@ class TimesheetProcessor:
 
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+    def format_hours_to_time_vectorized(self, decimal_hours) -> pd.Series:
+        """Vectorized format_hours_to_time over a whole column
+
+        Args:
+            decimal_hours: Series or array of float hours
+
+        Returns:
+            Series of HH:MM:SS strings aligned with the input
+        """
+        decimal_hours = pd.Series(decimal_hours, dtype=float)
+        values = decimal_hours.to_numpy()
+
+        # Same truncation steps as format_hours_to_time, on whole arrays
+        hours = np.trunc(values)
+        remaining_minutes = (values - hours) * 60
+        minutes = np.trunc(remaining_minutes)
+        seconds = np.trunc((remaining_minutes - minutes) * 60)
+
+        zero = np.isnan(values) | (values == 0)
+        hours, minutes, seconds = (
+            pd.Series(np.where(zero, 0, part), index=decimal_hours.index)
+            .astype(np.int64)
+            .astype(str)
+            .str.zfill(2)
+            for part in (hours, minutes, seconds)
+        )
+        return hours + ":" + minutes + ":" + seconds
+
     def parse_date_time(self, date_str, time_str):
         """Parse separate date and time strings"""
         if pd.isna(date_str) or pd.isna(time_str) or date_str == "" or time_str == "":
@@ -189,14 +244,7 @@ class TimesheetProcessor:
             return None, None
         try:
             # Try multiple formats
-            formats_to_try = [
-                "%d/%m/%Y %H:%M:%S",  # 01/08/2025 06:43:19
-                "%m/%d/%Y %H:%M:%S",  # 08/01/2025 06:43:19
-                "%d-%b-%y %H:%M:%S",  # 19-Apr-25 7:40:09
-                "%d-%b-%Y %H:%M:%S",  # 19-Apr-2025 7:40:09
-            ]
-
-            for fmt in formats_to_try:
+            for fmt in self.INLINE_DATETIME_FORMATS:
                 try:
                     dt_obj = pd.to_datetime(datetime_str, format=fmt)
                     date_obj = dt_obj.date()
@@ -213,6 +261,46 @@ class TimesheetProcessor:
         except:
             return None, None
 
+    def parse_datetime_columns(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized version of parse_inline_datetime / parse_date_time
+
+        Parses the whole 'Date/Time' column (or 'Date' + 'Time') in a few
+        C-level passes instead of one Python call per row.
+
+        Returns:
+            datetime64 Series aligned with df, NaT where parsing failed
+        """
+        if "Date/Time" in df.columns:
+            raw = df["Date/Time"]
+            formats = self.INLINE_DATETIME_FORMATS
+            parsed = pd.to_datetime(raw, format=formats[0], errors="coerce")
+            for fmt in formats[1:]:
+                pending = parsed.isna() & raw.notna()
+                if not pending.any():
+                    break
+                parsed = parsed.fillna(
+                    pd.to_datetime(raw[pending], format=fmt, errors="coerce")
+                )
+
+            # Anything left goes through pandas automatic (per-value) parsing
+            pending = parsed.isna() & raw.notna()
+            if pending.any():
+                parsed = parsed.fillna(
+                    pd.to_datetime(
+                        raw[pending], format="mixed", dayfirst=True, errors="coerce"
+                    )
+                )
+            return parsed
+
+        # Dates are parsed per value (like the scalar parser) so a column that
+        # mixes formats isn't forced onto the format inferred from row one
+        dates = pd.to_datetime(
+            df["Date"], format="mixed", dayfirst=True, errors="coerce"
+        )
+        times = pd.to_datetime(df["Time"], format="%H:%M:%S", errors="coerce")
+
+        return dates.dt.normalize() + (times - times.dt.normalize())
+
     def find_first_checkin_last_checkout(self, employee_day_records):
         """Find FIRST check-in and LAST check-out for an employee on a specific date
 
@@ -246,6 +334,20 @@ class TimesheetProcessor:
 
         return start_time, end_time
 
+    @staticmethod
+    def time_to_seconds(t):
+        """Convert a time object to integer seconds since midnight"""
+        return t.hour * 3600 + t.minute * 60 + t.second
+
+    @staticmethod
+    def round_hours(hours):
+        """Round an array of hours to 2 decimals with Python's round(), the
+        same rounding the per-shift figures have always used"""
+        return np.array(
+            [round(h, 2) for h in np.asarray(hours, dtype=float).tolist()],
+            dtype=float,
+        )
+
     def determine_shift_type(self, start_time):
         """Determine shift type based on FIRST check-in time
         Day Shift: 06:00 AM - 16:09 PM
@@ -253,9 +355,9 @@ class TimesheetProcessor:
         if start_time is None:
             return ""
 
-        start_hour = start_time.hour + start_time.minute / 60 + start_time.second / 3600
         # Night shift starts at 15:50 (3:50 PM) to catch early night shift workers
-        return "Day Shift" if start_hour < 15.8333 else "Night Shift"
+        start_sec = self.time_to_seconds(start_time)
+        return "Day Shift" if start_sec < self.NIGHT_SHIFT_START_SEC else "Night Shift"
 
     def calculate_total_work_hours(self, start_time, end_time, shift_type, work_date):
         """Calculate total work hours between start and end time
@@ -267,42 +369,44 @@ class TimesheetProcessor:
         if start_time is None or end_time is None:
             return 0
 
-        # Determine if this is a night shift
-        start_hour = start_time.hour + start_time.minute / 60
-        is_night_shift = (
-            start_hour >= 15.8333
-        )  # 15:50 (3:50 PM) - night shift detection
+        start_sec = self.time_to_seconds(start_time)
+        end_sec = self.time_to_seconds(end_time)
 
-        if is_night_shift:
-            # NIGHT SHIFT: Work counted from 18:00 PM to 03:00 AM
-            # Start counting from 18:00 PM (ignore early check-ins)
-            work_start_time = time(18, 0, 0)  # 18:00 PM
-            work_start_dt = datetime.combine(work_date, work_start_time)
+        if start_sec >= self.NIGHT_SHIFT_START_SEC:  # 15:50 (3:50 PM) - night shift
+            # NIGHT SHIFT: Work counted from 18:00 PM to the next-day check-out
+            # (ignore early check-ins)
+            total_sec = end_sec + 24 * 3600 - self.NIGHT_WORK_START_SEC
+        else:
+            # DAY SHIFT: Work counted from 08:00 AM (or a later check-in) to check-out
+            total_sec = end_sec - max(start_sec, self.DAY_WORK_START_SEC)
 
-            # End time is next day (cross-midnight)
-            work_end_dt = datetime.combine(work_date + timedelta(days=1), end_time)
+        return round(total_sec / 3600, 2)
 
-            # Calculate hours from 18:00 PM to check-out time
-            total_duration = work_end_dt - work_start_dt
-            total_hours = total_duration.total_seconds() / 3600
-        else:
-            # DAY SHIFT: Work counted from 08:00 AM to check-out time
-            # Start counting from 08:00 AM (ignore early check-ins)
-            if start_time < time(8, 0, 0):
-                # Employee checked in before 08:00 AM - start counting from 08:00
-                work_start_time = time(8, 0, 0)  # 08:00 AM
-            else:
-                # Employee checked in at or after 08:00 AM - use actual check-in
-                work_start_time = start_time
+    def calculate_total_work_hours_vectorized(self, start_sec, end_sec):
+        """Vectorized calculate_total_work_hours over a whole consolidated frame
 
-            work_start_dt = datetime.combine(work_date, work_start_time)
-            work_end_dt = datetime.combine(work_date, end_time)
+        Args:
+            start_sec: Check-in times as seconds since midnight (NaN if missing)
+            end_sec: Check-out times as seconds since midnight (NaN if missing)
 
-            # Calculate hours from work start to check-out
-            total_duration = work_end_dt - work_start_dt
-            total_hours = total_duration.total_seconds() / 3600
+        Returns:
+            NumPy array of total hours rounded to 2 decimals (0 if missing)
+        """
+        start_sec = np.asarray(start_sec, dtype=float)
+        end_sec = np.asarray(end_sec, dtype=float)
 
-        return round(total_hours, 2)
+        has_pair = ~(np.isnan(start_sec) | np.isnan(end_sec))
+        night = start_sec >= self.NIGHT_SHIFT_START_SEC
+
+        # Night: 18:00 PM to next-day checkout; Day: max(check-in, 08:00 AM)
+        total_sec = np.where(
+            night,
+            end_sec + 24 * 3600 - self.NIGHT_WORK_START_SEC,
+            end_sec - np.maximum(start_sec, self.DAY_WORK_START_SEC),
+        )
+
+        # Same rounding as calculate_total_work_hours
+        return np.where(has_pair, self.round_hours(total_sec / 3600), 0)
 
     def calculate_overtime_hours(self, start_time, end_time, shift_type, work_date):
         """Calculate overtime hours based on your specific business rules
@@ -322,41 +426,70 @@ class TimesheetProcessor:
         if start_time is None or end_time is None or shift_type == "":
             return 0
 
+        end_decimal = end_time.hour + end_time.minute / 60 + end_time.second / 3600
         overtime = 0
 
         if shift_type == "Day Shift":
-            # Day shift overtime only after 17:00 PM
-            end_decimal = end_time.hour + end_time.minute / 60 + end_time.second / 3600
-            if end_decimal > 17.0:  # After 5:00 PM
-                overtime = end_decimal - 17.0
-                # Apply day shift rules: min 30 min, max 1.5 hours
-                if overtime < 0.5:  # Less than 30 minutes
-                    overtime = 0
-                elif overtime > 1.5:  # More than 1.5 hours
-                    overtime = 1.5
+            # Day shift overtime only after 17:00 PM, max 1.5 hours
+            overtime = min(
+                end_decimal - self.DAY_OVERTIME_START_SEC / 3600,
+                self.DAY_MAX_OVERTIME_SEC / 3600,
+            )
 
         elif shift_type == "Night Shift":
-            # For night shift, we need to handle cross-midnight calculation
-            start_decimal = (
-                start_time.hour + start_time.minute / 60 + start_time.second / 3600
-            )
-            end_decimal = end_time.hour + end_time.minute / 60 + end_time.second / 3600
-
-            # If end time is early morning (cross-midnight), check for overtime after 3:00 AM
-            if end_decimal <= 12.0:  # Early morning hours (00:00 - 12:00)
-                if end_decimal > 3.0:  # After 3:00 AM = overtime
-                    overtime = end_decimal - 3.0
-                    # Apply night shift rules: min 30 min, max 3 hours
-                    if overtime < 0.5:  # Less than 30 minutes
-                        overtime = 0
-                    elif overtime > 3.0:  # More than 3 hours
-                        overtime = 3.0
-            else:
-                # End time is same day (no cross-midnight) - no overtime for night shift
-                overtime = 0
+            # Night shift overtime only after 03:00 AM on a cross-midnight checkout
+            # (00:00 - 12:00), max 3 hours
+            if end_decimal <= self.NIGHT_CHECKOUT_CUTOFF_SEC / 3600:
+                overtime = min(
+                    end_decimal - self.NIGHT_OVERTIME_START_SEC / 3600,
+                    self.NIGHT_MAX_OVERTIME_SEC / 3600,
+                )
+
+        # Less than 30 minutes = no overtime
+        if overtime < self.MIN_OVERTIME_SEC / 3600:
+            return 0
 
         return round(overtime, 2)
 
+    def calculate_overtime_hours_vectorized(self, start_sec, end_sec):
+        """Vectorized calculate_overtime_hours over a whole consolidated frame
+
+        Args:
+            start_sec: Check-in times as seconds since midnight (NaN if missing)
+            end_sec: Check-out times as seconds since midnight (NaN if missing)
+
+        Returns:
+            NumPy array of overtime hours rounded to 2 decimals (0 if missing)
+        """
+        start_sec = np.asarray(start_sec, dtype=float)
+        end_sec = np.asarray(end_sec, dtype=float)
+
+        has_pair = ~(np.isnan(start_sec) | np.isnan(end_sec))
+        night = start_sec >= self.NIGHT_SHIFT_START_SEC
+
+        # Checkout as decimal hours, summed the same way as the per-shift
+        # hour + minute / 60 + second / 3600 so the rounded values match
+        end_decimal = end_sec // 3600 + end_sec % 3600 // 60 / 60 + end_sec % 60 / 3600
+
+        day_overtime = np.minimum(
+            end_decimal - self.DAY_OVERTIME_START_SEC / 3600,
+            self.DAY_MAX_OVERTIME_SEC / 3600,
+        )
+        night_overtime = np.where(
+            end_decimal <= self.NIGHT_CHECKOUT_CUTOFF_SEC / 3600,
+            np.minimum(
+                end_decimal - self.NIGHT_OVERTIME_START_SEC / 3600,
+                self.NIGHT_MAX_OVERTIME_SEC / 3600,
+            ),
+            0,
+        )
+        overtime = np.where(night, night_overtime, day_overtime)
+        overtime = np.where(
+            has_pair & (overtime >= self.MIN_OVERTIME_SEC / 3600), overtime, 0
+        )
+
+        return self.round_hours(overtime)
+
     def calculate_regular_hours(self, total_hours, overtime_hours):
         """Calculate regular hours (total - overtime)"""
         if total_hours == 0:
@@ -427,11 +560,28 @@ class TimesheetProcessor:
         self, file_obj, filename: str
     ) -> Optional[pd.DataFrame]:
         """Load Excel file with multiple engine fallbacks for maximum compatibility"""
+        # calamine parses the workbook natively instead of building openpyxl's
+        # Python cell objects; the other engines remain as fallbacks
         engines = ["openpyxl", "xlrd", None]  # None uses default engine
+        if CALAMINE_AVAILABLE:
+            engines.insert(0, "calamine")
+
+        # Large workbooks: stream openpyxl rows in chunks rather than letting
+        # read_excel hold every row as a Python list before building the frame
+        if "openpyxl" in engines and hasattr(file_obj, "seek"):
+            file_size = file_obj.seek(0, io.SEEK_END)
+            if file_size > self.LARGE_EXCEL_BYTES:
+                engines.remove("openpyxl")
+                engines.insert(0, "openpyxl-chunked")
 
         for engine in engines:
             try:
-                if engine:
+                # Rewind file objects left part-read by a failed engine
+                if hasattr(file_obj, "seek"):
+                    file_obj.seek(0)
+                if engine == "openpyxl-chunked":
+                    df = self.read_excel_chunked(file_obj)
+                elif engine:
                     df = pd.read_excel(file_obj, engine=engine)
                 else:
                     df = pd.read_excel(file_obj)
@@ -443,6 +593,57 @@ class TimesheetProcessor:
                 continue
         return None
 
+    def read_excel_chunked(self, file_obj) -> pd.DataFrame:
+        """Read the first sheet like pd.read_excel(engine="openpyxl"), building
+        the frame EXCEL_CHUNK_ROWS rows at a time from a read-only workbook"""
+        from itertools import islice
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_obj, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+            if header is None:
+                return pd.DataFrame()
+
+            # Header names as read_excel gives them: blanks become "Unnamed: i",
+            # repeated names get ".1", ".2", ... suffixes
+            columns = []
+            seen = {}
+            for i, name in enumerate(header):
+                name = f"Unnamed: {i}" if name is None else name
+                if name in seen:
+                    seen[name] += 1
+                    name = f"{name}.{seen[name]}"
+                else:
+                    seen[name] = 0
+                columns.append(name)
+
+            # max_col pads short rows with None so every chunk lines up
+            rows = sheet.iter_rows(min_row=2, max_col=len(columns), values_only=True)
+            chunks = []
+            while True:
+                block = list(islice(rows, self.EXCEL_CHUNK_ROWS))
+                if not block:
+                    break
+                chunks.append(pd.DataFrame.from_records(block, columns=columns))
+        finally:
+            workbook.close()
+
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(chunks, ignore_index=True)
+        # Chunks can disagree on dtypes (a chunk of blanks is object), so
+        # blanks become NaN and object columns are re-inferred once
+        object_cols = df.columns[df.dtypes == object]
+        if len(object_cols):
+            blanks_as_nan = df[object_cols].where(df[object_cols].notna(), np.nan)
+            df[object_cols] = blanks_as_nan.infer_objects()
+        # read_excel drops trailing blank rows
+        last_row = df.last_valid_index()
+        return df.iloc[: 0 if last_row is None else last_row + 1]
+
     def detect_and_fix_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Automatically detect and fix/normalize column names"""
         if df is None or df.empty:
@@ -560,6 +761,13 @@ class TimesheetProcessor:
 
         return df
 
+    def categorize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast the low-cardinality Name and Status columns to categoricals"""
+        for col in ["Name", "Status"]:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+        return df
+
     def load_timesheet_file(self, uploaded_file) -> Optional[pd.DataFrame]:
         """Load timesheet data from uploaded file - supports ALL Excel formats and auto-corrects columns"""
         try:
@@ -570,13 +778,11 @@ class TimesheetProcessor:
                 or uploaded_file.name.lower().endswith(".xlsm")
                 or uploaded_file.name.lower().endswith(".xlsb")
             ):
-                df = self.load_excel_with_fallback(uploaded_file, uploaded_file.name)
+                df = _read_timesheet_bytes(uploaded_file.getvalue(), uploaded_file.name)
                 if df is None:
                     return None
             elif uploaded_file.name.lower().endswith(".csv"):
-                df = pd.read_csv(
-                    uploaded_file, encoding="utf-8", encoding_errors="ignore"
-                )
+                df = _read_timesheet_bytes(uploaded_file.getvalue(), uploaded_file.name)
             else:
                 st.error(
                     "❌ Unsupported file format. Supported: .xlsx, .xls, .xlsm, .xlsb, .csv"
@@ -647,6 +853,9 @@ class TimesheetProcessor:
                 )
                 return None
 
+            # Low-cardinality columns as categoricals: groupby/isin work on codes
+            df = self.categorize_columns(df)
+
             st.success(f"✅ File ready for processing with columns: {list(df.columns)}")
             return df
 
@@ -671,12 +880,11 @@ class TimesheetProcessor:
                 or file_path.lower().endswith(".xlsm")
                 or file_path.lower().endswith(".xlsb")
             ):
-                with open(file_path, "rb") as f:
-                    df = self.load_excel_with_fallback(f, file_path)
+                df = _read_timesheet_path(file_path, os.path.getmtime(file_path))
                 if df is None:
                     return None
             elif file_path.lower().endswith(".csv"):
-                df = pd.read_csv(file_path, encoding="utf-8", encoding_errors="ignore")
+                df = _read_timesheet_path(file_path, os.path.getmtime(file_path))
             else:
                 st.error(
                     "❌ Unsupported file format. Supported: .xlsx, .xls, .xlsm, .xlsb, .csv"
@@ -719,34 +927,109 @@ class TimesheetProcessor:
                 st.info(f"💡 Available columns: {list(df.columns)}")
                 return None
 
-            return df
+            # Low-cardinality columns as categoricals: groupby/isin work on codes
+            return self.categorize_columns(df)
 
         except Exception as e:
             st.error(f"❌ Error loading file: {str(e)}")
             return None
 
-    def consolidate_timesheet_data(self, df, show_warnings=True) -> pd.DataFrame:
-        """Master function to consolidate timesheet data and apply business rules"""
-        df_work = df.copy()
-        unnecessary_cols = [col for col in df_work.columns if "Unnamed" in col]
-        for col in unnecessary_cols:
-            df_work = df_work.drop(col, axis=1)
+    def consolidate_timesheet_data(
+        self, df, show_warnings=True, include_entry_details=False
+    ) -> pd.DataFrame:
+        """Master function to consolidate timesheet data and apply business rules
+
+        The "Entry Details" audit column is only built when
+        include_entry_details is set.
+        """
+        # drop() returns a new frame, so the caller's df is never modified
+        unnecessary_cols = [col for col in df.columns if "Unnamed" in col]
+        df_work = df.drop(columns=unnecessary_cols)
 
         if "Date/Time" in df_work.columns:
             st.info("🔄 Processing inline Date/Time format...")
-            df_work[["Date_parsed", "Time_parsed"]] = df_work.apply(
-                lambda row: pd.Series(self.parse_inline_datetime(row["Date/Time"])),
-                axis=1,
-            )
-        else:
-            df_work[["Date_parsed", "Time_parsed"]] = df_work.apply(
-                lambda row: pd.Series(self.parse_date_time(row["Date"], row["Time"])),
-                axis=1,
-            )
+        parsed_dt = self.parse_datetime_columns(df_work)
+
+        # Dates stay datetime64 internally and times become integer seconds
+        # below - no per-row datetime.time objects; drop unparseable rows in
+        # one pass
+        df_work["DateTime_parsed"] = parsed_dt
+        df_work["Date_parsed"] = parsed_dt.dt.normalize()
 
         initial_count = len(df_work)
-        df_work = df_work[df_work["Date_parsed"].notna()]
-        df_work = df_work[df_work["Time_parsed"].notna()]
+        df_work = df_work.dropna(subset=["Date_parsed"]).reset_index(drop=True)
+
+        # Name and Status are low-cardinality keys: as categoricals the sort,
+        # groupbys and isin() below run on integer codes instead of hashing
+        # strings row by row
+        df_work["Name"] = df_work["Name"].astype("category")
+        df_work["Status"] = df_work["Status"].astype("category")
+
+        # Seconds since midnight as one contiguous int32 column; shift/orphan
+        # checks compare against this instead of per-row time objects
+        df_work["sec_of_day"] = (
+            (df_work["DateTime_parsed"] - df_work["Date_parsed"])
+            .dt.total_seconds()
+            .astype("int32")
+        )
+
+        # Classify check-ins/check-outs once: Status has only a handful of
+        # distinct values, so decide on the uniques and use set membership
+        # ("In" without "Out" = check-in, e.g. C/In / OverTime In; any "Out" = check-out)
+        unique_statuses = [s for s in df_work["Status"].unique() if isinstance(s, str)]
+        checkin_statuses = {s for s in unique_statuses if "In" in s and "Out" not in s}
+        checkout_statuses = {
+            s for s in unique_statuses if "Out" in s and s not in checkin_statuses
+        }
+        df_work["is_checkin"] = df_work["Status"].isin(checkin_statuses)
+        df_work["is_checkout"] = df_work["Status"].isin(checkout_statuses)
+
+        # Employees are paired in file order
+        employees = df_work["Name"].unique()
+        total_employees = len(employees)
+
+        # Sort chronologically once (stable, so same-second punches keep their
+        # file order); the first/last flags below and every employee slice in
+        # the pairing loop rely on this order
+        df_work = df_work.sort_values(
+            ["Name", "Date_parsed", "sec_of_day"], kind="stable", ignore_index=True
+        )
+        is_checkin = df_work["is_checkin"]
+        is_checkout = df_work["is_checkout"]
+
+        # Cross-midnight detection for the whole frame in one groupby pass: a
+        # checkout belongs to the previous day's night shift when it happens
+        # before that day's earliest check-in, or in the morning (< 12:00) on a
+        # day without any check-in
+        time_of_day = df_work["sec_of_day"]
+        day_keys = [df_work["Name"], df_work["Date_parsed"]]
+        earliest_checkin = (
+            time_of_day.where(is_checkin)
+            .groupby(day_keys, observed=True, sort=False)
+            .transform("min")
+        )
+        df_work["_orphan_checkout"] = is_checkout & (
+            (earliest_checkin.notna() & (time_of_day < earliest_checkin))
+            | (earliest_checkin.isna() & (time_of_day < 12 * 3600))
+        )
+
+        # Multiple entries per employee-day: flag the EARLIEST check-in and the
+        # LATEST same-day check-out (orphans excluded) so the employee loop
+        # doesn't rescan every day's entries. df_work is already in time order,
+        # so these are first/last rows per day - drop_duplicates instead of a
+        # groupby. Same-second ties resolve to the earlier row for both
+        day_cols = ["Name", "Date_parsed", "sec_of_day"]
+        checkins = df_work.loc[is_checkin, day_cols]
+        first_checkin_idx = checkins.index[~checkins.duplicated(day_cols[:2])]
+        same_day_checkout = is_checkout & ~df_work["_orphan_checkout"]
+        checkout_times = df_work.loc[same_day_checkout, day_cols].drop_duplicates(
+            day_cols
+        )
+        last_checkout_idx = checkout_times.index[
+            ~checkout_times.duplicated(day_cols[:2], keep="last")
+        ]
+        df_work["_first_checkin"] = df_work.index.isin(first_checkin_idx)
+        df_work["_last_checkout"] = df_work.index.isin(last_checkout_idx)
 
         st.info(
             f"📊 Processing {len(df_work)} valid records from {initial_count} total records"
@@ -755,7 +1038,7 @@ class TimesheetProcessor:
         # Show sample of data being processed
         if len(df_work) > 0:
             st.info(
-                f"📋 Sample data - Employees: {df_work['Name'].nunique()}, Date range: {df_work['Date_parsed'].min()} to {df_work['Date_parsed'].max()}"
+                f"📋 Sample data - Employees: {df_work['Name'].nunique()}, Date range: {df_work['Date_parsed'].min().date()} to {df_work['Date_parsed'].max().date()}"
             )
             # Show unique status values found
             unique_statuses = df_work["Status"].unique()
@@ -764,54 +1047,93 @@ class TimesheetProcessor:
             )
 
             # Count check-ins and check-outs
-            checkins = df_work[
-                df_work["Status"].str.contains("In", case=False, na=False)
-            ]
-            checkouts = df_work[
-                df_work["Status"].str.contains("Out", case=False, na=False)
-            ]
             st.info(
-                f"✅ Found {len(checkins)} check-in records and {len(checkouts)} check-out records"
+                f"✅ Found {int(is_checkin.sum())} check-in records and {int(is_checkout.sum())} check-out records"
             )
 
             # DEBUG: Show first few records for RUGANINTWALI SALEH
             debug_employee = "RUGANINTWALI SALEH"
             if debug_employee in df_work["Name"].values:
-                debug_df = df_work[df_work["Name"] == debug_employee][
-                    ["Date_parsed", "Time_parsed", "Status"]
-                ].head(15)
+                debug_rows = df_work[df_work["Name"] == debug_employee].head(15)
+                debug_df = pd.DataFrame(
+                    {
+                        "Date_parsed": debug_rows["Date_parsed"],
+                        "Time_parsed": debug_rows["DateTime_parsed"].dt.time,
+                        "Status": debug_rows["Status"],
+                    }
+                )
                 st.info(f"🔍 DEBUG - First 15 records for {debug_employee}:")
                 st.dataframe(debug_df)
 
         progress_bar = st.progress(0)
         status_text = st.empty()
 
-        consolidated_rows = []
+        # Consolidated rows are collected column-wise (one list per column) and
+        # turned into a DataFrame once; times, hours and entry details are
+        # derived from these columns vectorized after the loop
+        consolidated_rows = {
+            "Name": [],
+            "_work_date": [],
+            "Check In Status": [],
+            "Check Out Status": [],
+            "_start_sec": [],
+            "_end_sec": [],
+            "_start_date": [],
+            "_end_date": [],
+        }
+        row_columns = list(consolidated_rows.values())
+
+        # Per-record notices are collected and rendered once after the loop;
+        # one st.* call per record is one websocket message per record
+        kept_without_checkout = []
+        loop_warnings = []
+        loop_errors = []
+
+        # Only the columns the pairing loop reads are materialized per record
+        record_columns = [
+            "Date_parsed",
+            "sec_of_day",
+            "Status",
+            "is_checkin",
+            "is_checkout",
+            "_first_checkin",
+            "_last_checkout",
+            "_orphan_checkout",
+        ]
+        record_values = [df_work[col].tolist() for col in record_columns]
 
-        # Group by employee only, then pair check-ins with check-outs
-        employees = df_work["Name"].unique()
-        total_employees = len(employees)
+        # One groupby pass locates every employee's rows; since df_work is
+        # sorted by Name each employee is a contiguous block, so there is no
+        # per-employee df_work["Name"] == employee scan over the whole frame
+        employee_rows = df_work.groupby("Name", observed=True, sort=False).indices
+
+        # Refresh the progress widgets ~100 times in total, not per employee
+        progress_step = max(1, total_employees // 100)
 
         for emp_idx, employee in enumerate(employees):
-            try:
-                emp_data = df_work[df_work["Name"] == employee].sort_values(
-                    ["Date_parsed", "Time_parsed"]
+            if emp_idx % progress_step == 0:
+                progress_bar.progress(emp_idx / total_employees)
+                status_text.text(
+                    f"Processing: {employee} ({emp_idx + 1}/{total_employees})"
                 )
 
-                # Get all records in chronological order
-                all_records = emp_data.to_dict("records")
+            try:
+                rows = employee_rows.get(employee, [])
+                emp_slice = slice(rows[0], rows[-1] + 1) if len(rows) else slice(0)
+
+                # Get all records in chronological order, built from the column
+                # arrays directly rather than a full-width to_dict("records")
+                all_records = [
+                    dict(zip(record_columns, values))
+                    for values in zip(*(col[emp_slice] for col in record_values))
+                ]
 
                 # CRITICAL: Track ALL records to ensure none are lost
                 all_record_ids = set(range(len(all_records)))
                 used_record_ids = set()
             except Exception as e:
-                if show_warnings:
-                    st.error(
-                        f"❌ {employee} - Critical error initializing data: {str(e)}"
-                    )
-                progress_bar.progress((emp_idx + 1) / total_employees)
-                status_text.text(
-                    f"ERROR Processing: {employee} ({emp_idx + 1}/{total_employees})"
+                loop_errors.append(
+                    f"❌ {employee} - Critical error initializing data: {str(e)}"
                 )
                 continue
 
@@ -821,55 +1143,35 @@ class TimesheetProcessor:
                 record["_record_id"] = idx  # Add tracking ID
                 date_key = record["Date_parsed"]
                 if date_key not in daily_records:
-                    daily_records[date_key] = {"ins": [], "outs": []}
+                    daily_records[date_key] = {
+                        "ins": [],
+                        "outs": [],
+                        "first_in": None,
+                        "last_out": None,
+                    }
 
-                status = record["Status"]
-                # Any status with "In" (C/In, OverTime In, etc.) is a check-in
-                if "In" in status and "Out" not in status:
+                # Check-in/check-out flags were precomputed for the whole frame
+                if record["is_checkin"]:
                     daily_records[date_key]["ins"].append(record)
-                # Any status with "Out" (C/Out, OverTime Out, etc.) is a check-out
-                elif "Out" in status:
+                    if record["_first_checkin"]:
+                        daily_records[date_key]["first_in"] = record
+                elif record["is_checkout"]:
                     daily_records[date_key]["outs"].append(record)
+                    if record["_last_checkout"]:
+                        daily_records[date_key]["last_out"] = record
 
             # Second pass: Consolidate daily records (earliest check-in, latest check-out)
             processed_dates = set()
             orphaned_checkouts = {}  # Track check-outs that belong to previous day
 
-            # PRE-PROCESSING PHASE: Identify ALL orphaned checkouts BEFORE main processing
-            # This ensures we find them before we process the dates they belong to
-            for work_date in sorted(daily_records.keys()):
-                day_ins = daily_records[work_date]["ins"]
-                day_outs = daily_records[work_date]["outs"]
-
-                if not day_ins and not day_outs:
-                    continue
-
-                # Check for orphaned checkouts (checkouts before check-ins, or checkouts without check-ins)
-                if day_outs:
-                    if day_ins:
-                        # We have BOTH check-ins and check-outs
-                        earliest_checkin = min(day_ins, key=lambda x: x["Time_parsed"])
-                        earliest_checkin_time = earliest_checkin["Time_parsed"]
-
-                        # Find checkouts that happen BEFORE the earliest check-in
-                        for out_record in day_outs:
-                            if out_record["Time_parsed"] < earliest_checkin_time:
-                                # This checkout belongs to previous day's night shift
-                                prev_date = work_date - timedelta(days=1)
-                                if prev_date not in orphaned_checkouts:
-                                    orphaned_checkouts[prev_date] = []
-                                orphaned_checkouts[prev_date].append(out_record)
-                    else:
-                        # Only checkouts, NO check-ins on this day
-                        # Check if they're morning checkouts (< 12:00 PM) - belong to previous night
-                        for out_record in day_outs:
-                            out_time = out_record["Time_parsed"]
-                            if out_time.hour < 12:
-                                # Morning checkout without check-in = previous day's night shift
-                                prev_date = work_date - timedelta(days=1)
-                                if prev_date not in orphaned_checkouts:
-                                    orphaned_checkouts[prev_date] = []
-                                orphaned_checkouts[prev_date].append(out_record)
+            # PRE-PROCESSING PHASE: Collect orphaned checkouts (flagged vectorized
+            # above) under the previous day they belong to, before main processing
+            for record in all_records:
+                if record["_orphan_checkout"]:
+                    prev_date = record["Date_parsed"] - timedelta(days=1)
+                    if prev_date not in orphaned_checkouts:
+                        orphaned_checkouts[prev_date] = []
+                    orphaned_checkouts[prev_date].append(record)
 
             # MAIN PROCESSING PHASE: Now process each date with orphaned checkouts already identified
 
@@ -885,38 +1187,26 @@ class TimesheetProcessor:
                     if not day_ins and not day_outs:
                         continue
                 except Exception as e:
-                    if show_warnings:
-                        st.warning(
-                            f"⚠️ {employee} - Error processing date {work_date}: {str(e)}"
-                        )
+                    loop_warnings.append(
+                        f"⚠️ {employee} - Error processing date {work_date}: {str(e)}"
+                    )
                     continue
 
                 # Filter out checkouts that were moved to previous day's orphaned list
                 # (These were morning checkouts that belong to previous night shift)
-                valid_outs_for_today = []
-
                 if day_outs:
-                    # Check if any of this day's checkouts were assigned to PREVIOUS day
-                    prev_date = work_date - timedelta(days=1)
-                    orphaned_to_prev = set()
-                    if prev_date in orphaned_checkouts:
-                        orphaned_to_prev = {
-                            rec["_record_id"] for rec in orphaned_checkouts[prev_date]
-                        }
-
-                    # Keep only checkouts that were NOT moved to previous day
-                    for out_record in day_outs:
-                        if out_record["_record_id"] not in orphaned_to_prev:
-                            valid_outs_for_today.append(out_record)
-
-                    day_outs = valid_outs_for_today
+                    day_outs = [
+                        out_record
+                        for out_record in day_outs
+                        if not out_record["_orphan_checkout"]
+                    ]
 
                 # Consolidate multiple check-ins: Use EARLIEST check-in
                 try:
                     if day_ins:
-                        checkin_record = min(day_ins, key=lambda x: x["Time_parsed"])
+                        checkin_record = daily_records[work_date]["first_in"]
                         checkin_date = checkin_record["Date_parsed"]
-                        checkin_time = checkin_record["Time_parsed"]
+                        checkin_sec = checkin_record["sec_of_day"]
                         # Use the actual status from the record (C/In, OverTime In, etc.)
                         checkin_status = checkin_record["Status"]
                         has_checkin = True
@@ -925,10 +1215,9 @@ class TimesheetProcessor:
                     else:
                         has_checkin = False
                 except Exception as e:
-                    if show_warnings:
-                        st.warning(
-                            f"⚠️ {employee} - Error processing check-in for {work_date.strftime('%d/%m/%Y')}: {str(e)}"
-                        )
+                    loop_warnings.append(
+                        f"⚠️ {employee} - Error processing check-in for {work_date.strftime('%d/%m/%Y')}: {str(e)}"
+                    )
                     has_checkin = False
                     continue
 
@@ -941,15 +1230,16 @@ class TimesheetProcessor:
 
                 # Check if this is a night shift (starts at or after 16:10)
                 if has_checkin:
-                    checkin_hour = checkin_time.hour + checkin_time.minute / 60
-                    is_night_shift = checkin_hour >= 15.8333  # 15:50 (3:50 PM)
+                    is_night_shift = (
+                        checkin_sec >= self.NIGHT_SHIFT_START_SEC
+                    )  # 15:50 (3:50 PM)
                 else:
                     is_night_shift = False
 
                 # For night shifts, check next day for check-outs too
                 checkout_found = False
                 checkout_date = None
-                checkout_time = None
+                checkout_sec = None
                 checkout_status = None
 
                 if is_night_shift:
@@ -964,35 +1254,25 @@ class TimesheetProcessor:
 
                     # SECOND: Add next day's check-outs if they exist
                     if next_date in daily_records:
-                        next_day_outs = daily_records[next_date]["outs"]
-                        next_day_ins = daily_records[next_date]["ins"]
-
-                        for next_out in next_day_outs:
-                            # Skip if already used
-                            if next_out["_record_id"] in used_record_ids:
-                                continue
-
-                            # Check if this check-out happens BEFORE any check-in on next day
-                            if next_day_ins:
-                                earliest_next_in = min(
-                                    next_day_ins, key=lambda x: x["Time_parsed"]
-                                )
-                                if (
-                                    next_out["Time_parsed"]
-                                    < earliest_next_in["Time_parsed"]
-                                ):
-                                    all_outs.append(next_out)
-                            else:
-                                # No check-ins on next day, ALL checkouts belong to current shift
-                                all_outs.append(next_out)
+                        next_day = daily_records[next_date]
+                        # A next-day check-out belongs to this shift when it happens
+                        # BEFORE any check-in on next day (already flagged as orphan);
+                        # with no check-ins on next day, ALL its check-outs do
+                        next_day_has_ins = bool(next_day["ins"])
+                        all_outs.extend(
+                            next_out
+                            for next_out in next_day["outs"]
+                            if next_out["_record_id"] not in used_record_ids
+                            and (next_out["_orphan_checkout"] or not next_day_has_ins)
+                        )
 
                     if all_outs:
                         # For night shift: Use LATEST check-out (could be next day)
                         checkout_record = max(
-                            all_outs, key=lambda x: (x["Date_parsed"], x["Time_parsed"])
+                            all_outs, key=lambda x: (x["Date_parsed"], x["sec_of_day"])
                         )
                         checkout_date = checkout_record["Date_parsed"]
-                        checkout_time = checkout_record["Time_parsed"]
+                        checkout_sec = checkout_record["sec_of_day"]
                         # Use the actual status from the record (C/Out, OverTime Out, etc.)
                         checkout_status = checkout_record["Status"]
                         checkout_found = True
@@ -1005,9 +1285,9 @@ class TimesheetProcessor:
                 else:
                     # Day shift: Use LATEST check-out from same day (only those AFTER check-in)
                     if day_outs:
-                        checkout_record = max(day_outs, key=lambda x: x["Time_parsed"])
+                        checkout_record = daily_records[work_date]["last_out"]
                         checkout_date = checkout_record["Date_parsed"]
-                        checkout_time = checkout_record["Time_parsed"]
+                        checkout_sec = checkout_record["sec_of_day"]
                         # Use the actual status from the record (C/Out, OverTime Out, etc.)
                         checkout_status = checkout_record["Status"]
                         checkout_found = True
@@ -1019,81 +1299,36 @@ class TimesheetProcessor:
                 if not checkout_found:
                     # No checkout found - mark as "No Checkout" but KEEP the record
                     checkout_date = checkin_date
-                    checkout_time = None
+                    checkout_sec = None
                     checkout_status = "No Checkout"
-                    if show_warnings:
-                        st.info(
-                            f"ℹ️ {employee} - {checkin_date.strftime('%d-%b')}: Check-in at {checkin_time.strftime('%H:%M')} without checkout - record kept"
-                        )
-
-                # Now process the record - calculate hours if we have both times
-                try:
-                    start_time = checkin_time
-                    end_time = checkout_time
-
-                    if end_time is not None:
-                        # Have both times - calculate normally
-                        shift_type = self.determine_shift_type(start_time)
-
-                        # Calculate total hours (handle midnight crossing)
-                        total_hours = self.calculate_total_work_hours(
-                            start_time, end_time, shift_type, work_date
-                        )
-
-                        # Calculate overtime hours
-                        overtime_hours = self.calculate_overtime_hours(
-                            start_time, end_time, shift_type, work_date
-                        )
-
-                        # Build entry details
-                        entry_details = f"{checkin_date.strftime('%d/%m/%Y')} {start_time.strftime('%H:%M:%S')}({checkin_status}) → {checkout_date.strftime('%d/%m/%Y')} {end_time.strftime('%H:%M:%S')}({checkout_status})"
-                    else:
-                        # Missing checkout - can't calculate hours
-                        shift_type = self.determine_shift_type(start_time)
-                        total_hours = 0
-                        overtime_hours = 0
-                        entry_details = f"{checkin_date.strftime('%d/%m/%Y')} {start_time.strftime('%H:%M:%S')}({checkin_status}) → No Checkout"
-                except Exception as e:
-                    if show_warnings:
-                        st.warning(
-                            f"⚠️ {employee} - Error calculating hours for {work_date.strftime('%d/%m/%Y')}: {str(e)}"
+                    kept_without_checkout.append(
+                        (
+                            employee,
+                            checkin_date.strftime("%d-%b"),
+                            f"{checkin_sec // 3600:02d}:{checkin_sec % 3600 // 60:02d}",
                         )
-                    # Skip this record if calculation fails
-                    continue
+                    )
 
-                # Create consolidated row
+                # Record the pairing (stale check-in values raise NameError on an
+                # employee's first day without a check-in - skip that row)
                 try:
-                    consolidated_row = {
-                        "Name": employee,
-                        "Date": work_date.strftime("%d-%b-%Y"),
-                        "Check In Status": checkin_status,
-                        "Start Time": start_time.strftime("%H:%M:%S"),
-                        "Check Out Status": checkout_status,
-                        "End Time": (
-                            end_time.strftime("%H:%M:%S")
-                            if end_time is not None
-                            else "N/A"
-                        ),
-                        "Total Hours": total_hours,
-                        "Overtime Hours": (
-                            self.format_hours_to_time(overtime_hours)
-                            if overtime_hours > 0
-                            else "00:00:00"
-                        ),
-                        "Overtime Hours (Decimal)": overtime_hours,
-                        "Original Entries": (
-                            2 if end_time is not None else 1
-                        ),  # Check-in + Check-out (or just check-in)
-                        "Entry Details": entry_details,
-                    }
-
-                    consolidated_rows.append(consolidated_row)
+                    row = (
+                        employee,
+                        work_date,
+                        checkin_status,
+                        checkout_status,
+                        checkin_sec,
+                        checkout_sec,
+                        checkin_date,
+                        checkout_date if checkout_sec is not None else None,
+                    )
                 except Exception as e:
-                    if show_warnings:
-                        st.warning(
-                            f"⚠️ {employee} - Error creating consolidated row for {work_date.strftime('%d/%m/%Y')}: {str(e)}"
-                        )
+                    loop_warnings.append(
+                        f"⚠️ {employee} - Error creating consolidated row for {work_date.strftime('%d/%m/%Y')}: {str(e)}"
+                    )
                     continue
+                for column, value in zip(row_columns, row):
+                    column.append(value)
 
                 # Mark records as used
                 if has_checkin and day_ins:
@@ -1114,79 +1349,108 @@ class TimesheetProcessor:
                     if checkout_rec["_record_id"] not in used_record_ids:
                         # This checkout was never paired - add it as orphaned entry
                         try:
-                            checkout_time = checkout_rec["Time_parsed"]
-                            checkout_date = checkout_rec["Date_parsed"]
-                            checkout_status = checkout_rec["Status"]
-
-                            entry_details = f"No Check-in → {checkout_date.strftime('%d/%m/%Y')} {checkout_time.strftime('%H:%M:%S')}({checkout_status})"
-
-                            orphaned_row = {
-                                "Name": employee,
-                                "Date": checkout_date.strftime("%d-%b-%Y"),
-                                "Check In Status": "Missing",
-                                "Start Time": "N/A",
-                                "Check Out Status": checkout_status,
-                                "End Time": checkout_time.strftime("%H:%M:%S"),
-                                "Total Hours": 0,
-                                "Overtime Hours": "00:00:00",
-                                "Overtime Hours (Decimal)": 0,
-                                "Original Entries": 1,  # Only checkout
-                                "Entry Details": entry_details,
-                            }
-
-                            consolidated_rows.append(orphaned_row)
+                            row = (
+                                employee,
+                                checkout_rec["Date_parsed"],
+                                "Missing",
+                                checkout_rec["Status"],
+                                None,
+                                checkout_rec["sec_of_day"],
+                                None,
+                                checkout_rec["Date_parsed"],
+                            )
+                            for column, value in zip(row_columns, row):
+                                column.append(value)
                             used_record_ids.add(checkout_rec["_record_id"])
                         except Exception as e:
-                            if show_warnings:
-                                st.warning(
-                                    f"⚠️ {employee} - Error processing orphaned checkout: {str(e)}"
-                                )
+                            loop_warnings.append(
+                                f"⚠️ {employee} - Error processing orphaned checkout: {str(e)}"
+                            )
 
-            # Update progress
-            progress_bar.progress((emp_idx + 1) / total_employees)
-            status_text.text(
-                f"Processing: {employee} ({emp_idx + 1}/{total_employees})"
-            )
         progress_bar.empty()
         status_text.empty()
 
+        if show_warnings:
+            if loop_errors:
+                st.error("\n\n".join(loop_errors))
+            if loop_warnings:
+                st.warning("\n\n".join(loop_warnings))
+            if kept_without_checkout:
+                st.info(
+                    f"ℹ️ {len(kept_without_checkout)} check-ins without checkout - records kept"
+                )
+                st.dataframe(
+                    pd.DataFrame(
+                        kept_without_checkout,
+                        columns=["Employee", "Date", "Check-in"],
+                    ),
+                    hide_index=True,
+                )
+
         # Safety check: Ensure we have data to process
-        if not consolidated_rows:
+        if not consolidated_rows["Name"]:
             st.error("❌ No valid check-in/check-out pairs found in the data")
             st.info(
                 "💡 Please ensure your data has complete pairs with both check-in and check-out times"
             )
             return pd.DataFrame()
 
-        try:
-            consolidated_df = pd.DataFrame(consolidated_rows)
-        except Exception as e:
-            st.error(f"❌ Error creating consolidated DataFrame: {str(e)}")
-            return pd.DataFrame()
-
-        # Check if DataFrame is empty or missing required columns
-        if consolidated_df.empty:
-            st.warning(
-                "⚠️ No records were consolidated. Please check if the data has valid check-in/check-out pairs."
-            )
-            return consolidated_df
+        # Sort by Name and Date (chronologically, not alphabetically)
+        rows = pd.DataFrame(consolidated_rows).sort_values(["Name", "_work_date"])
 
-        if (
-            "Name" not in consolidated_df.columns
-            or "Date" not in consolidated_df.columns
-        ):
-            st.error(
-                f"❌ Missing required columns after consolidation. Available columns: {consolidated_df.columns.tolist()}"
-            )
-            return consolidated_df
+        # Times, hours and entry details for every row in one pass each
+        start_sec = rows["_start_sec"].to_numpy(dtype=float, na_value=np.nan)
+        end_sec = rows["_end_sec"].to_numpy(dtype=float, na_value=np.nan)
+        start_clock = pd.to_datetime(start_sec, unit="s").strftime("%H:%M:%S")
+        end_clock = pd.to_datetime(end_sec, unit="s").strftime("%H:%M:%S")
+        overtime_hours = self.calculate_overtime_hours_vectorized(start_sec, end_sec)
 
-        # Sort by Name and Date (chronologically, not alphabetically)
-        # Convert Date string to datetime for proper sorting
-        consolidated_df["_sort_date"] = pd.to_datetime(
-            consolidated_df["Date"], format="%d-%b-%Y"
+        consolidated_df = pd.DataFrame(
+            {
+                "Name": rows["Name"],
+                "Date": pd.to_datetime(rows["_work_date"]).dt.strftime("%d-%b-%Y"),
+                "Check In Status": rows["Check In Status"],
+                "Start Time": pd.Series(start_clock, index=rows.index).fillna("N/A"),
+                "Check Out Status": rows["Check Out Status"],
+                "End Time": pd.Series(end_clock, index=rows.index).fillna("N/A"),
+                "Total Hours": self.calculate_total_work_hours_vectorized(
+                    start_sec, end_sec
+                ),
+                # Few distinct HH:MM:SS labels (mostly "00:00:00"): stored as
+                # a categorical so value_counts/comparisons run on codes
+                "Overtime Hours": pd.Categorical(
+                    self.format_hours_to_time_vectorized(overtime_hours).to_numpy()
+                ),
+                "Overtime Hours (Decimal)": overtime_hours,
+                # Check-in + Check-out (or just one of them)
+                "Original Entries": (~np.isnan(start_sec)).astype(int)
+                + (~np.isnan(end_sec)).astype(int),
+            }
         )
-        consolidated_df = consolidated_df.sort_values(["Name", "_sort_date"])
-        consolidated_df = consolidated_df.drop(columns=["_sort_date"])
+
+        # Entry details (audit only) as whole-column string concatenation
+        if include_entry_details:
+            checkin_part = (
+                pd.to_datetime(rows["_start_date"]).dt.strftime("%d/%m/%Y")
+                + " "
+                + consolidated_df["Start Time"]
+                + "("
+                + consolidated_df["Check In Status"].astype(str)
+                + ")"
+            )
+            checkout_part = (
+                pd.to_datetime(rows["_end_date"]).dt.strftime("%d/%m/%Y")
+                + " "
+                + consolidated_df["End Time"]
+                + "("
+                + consolidated_df["Check Out Status"].astype(str)
+                + ")"
+            )
+            consolidated_df["Entry Details"] = (
+                checkin_part.fillna("No Check-in")
+                + " → "
+                + checkout_part.fillna("No Checkout")
+            )
 
         # Data Quality Report
         st.markdown("---")
@@ -1282,9 +1546,10 @@ class TimesheetProcessor:
         df_complete.loc[missing_mask, "Overtime Hours"] = "00:00:00"
         df_complete.loc[missing_mask, "Overtime Hours (Decimal)"] = 0.0
         df_complete.loc[missing_mask, "Original Entries"] = 0
-        df_complete.loc[missing_mask, "Entry Details"] = (
-            "No attendance record for this date"
-        )
+        if "Entry Details" in df_complete.columns:
+            df_complete.loc[missing_mask, "Entry Details"] = (
+                "No attendance record for this date"
+            )
         df_complete.loc[missing_mask, "_has_missing_data"] = True
 
         # Drop temporary datetime column
@@ -1299,6 +1564,599 @@ class TimesheetProcessor:
         return df_complete
 
 
+def _read_timesheet_csv(source) -> pd.DataFrame:
+    """Parse a timesheet CSV from a path or binary buffer"""
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+        except Exception:
+            pass  # e.g. invalid UTF-8 - fall back to the tolerant C parser
+        if hasattr(source, "seek"):
+            source.seek(0)
+    # The C parser works through large exports in bounded chunks, so its
+    # tokenizer buffers never cover the whole file at once
+    chunks = pd.read_csv(
+        source, encoding="utf-8", encoding_errors="ignore", chunksize=200_000
+    )
+    return pd.concat(chunks, ignore_index=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _read_timesheet_bytes(file_bytes: bytes, filename: str) -> Optional[pd.DataFrame]:
+    """Parse an uploaded timesheet file, cached on its bytes so reruns skip I/O"""
+    if filename.lower().endswith(".csv"):
+        return _read_timesheet_csv(io.BytesIO(file_bytes))
+    return TimesheetProcessor().load_excel_with_fallback(
+        io.BytesIO(file_bytes), filename
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _read_timesheet_path(file_path: str, modified: float) -> Optional[pd.DataFrame]:
+    """Parse a timesheet file from disk, cached on its path and modification
+    time so reruns skip I/O until the file changes"""
+    if file_path.lower().endswith(".csv"):
+        return _read_timesheet_csv(file_path)
+    with open(file_path, "rb") as f:
+        return TimesheetProcessor().load_excel_with_fallback(f, file_path)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _consolidate_timesheet(
+    _raw_data: pd.DataFrame,
+    raw_version: str,
+    show_warnings: bool,
+    include_entry_details: bool = False,
+) -> pd.DataFrame:
+    """Consolidate a loaded timesheet, cached on the loaded file's version
+    (the frame is not hashed) and the flags, so re-running the consolidation
+    on the same file skips the pairing pass. Each caller gets its own copy."""
+    return TimesheetProcessor().consolidate_timesheet_data(
+        _raw_data, show_warnings, include_entry_details
+    )
+
+
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to CSV bytes"""
+    buffer = io.BytesIO()
+    # Rows are formatted and written 10k at a time straight into the buffer
+    df.to_csv(buffer, index=False, chunksize=10_000)
+    return buffer.getvalue()
+
+
+def _parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to Parquet bytes (requires pyarrow)"""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", compression="snappy", index=False)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _build_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame for a CSV download, cached so reruns reuse the bytes
+    (bounded, so new frames evict old blobs instead of piling up)"""
+    return _csv_bytes(df)
+
+
+def _excel_writer(buffer) -> pd.ExcelWriter:
+    """ExcelWriter for plain (unstyled) multi-sheet exports: xlsxwriter when
+    installed - faster and lighter than openpyxl's per-cell objects - else
+    openpyxl. constant_memory is not enabled: to_excel writes column by
+    column, and that mode only keeps the current row."""
+    if XLSXWRITER_AVAILABLE:
+        return pd.ExcelWriter(
+            buffer,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"strings_to_numbers": False}},
+        )
+    return pd.ExcelWriter(buffer, engine="openpyxl")
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _build_excel_bytes(sheets: Dict[str, pd.DataFrame]) -> bytes:
+    """Write plain sheets (name -> frame, in order) to .xlsx bytes, cached so
+    reruns reuse the workbook"""
+    output = io.BytesIO()
+    with _excel_writer(output) as writer:
+        for sheet_name, sheet_df in sheets.items():
+            sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _build_results_export(
+    _data: pd.DataFrame,
+    data_version: str,
+    display_columns: Tuple[str, ...],
+    file_format: str,
+) -> bytes:
+    """CSV or Parquet bytes of the session's consolidated data, cached on
+    its data_version - the frame itself (leading underscore) is not hashed"""
+    export_df = _data[list(display_columns)]
+    if file_format == "parquet":
+        return _parquet_bytes(export_df)
+    return _csv_bytes(export_df)
+
+
+def _append_frame_rows(sheet, df: pd.DataFrame) -> str:
+    """Stream a frame into a write-only openpyxl sheet, header styled like
+    to_excel's, and return the used range (e.g. "A1:K250")"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+    from openpyxl.utils import get_column_letter
+
+    thin = Side(style="thin")
+    header_font = Font(bold=True)
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal="center", vertical="top")
+
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(sheet, value=str(col))
+        cell.font = header_font
+        cell.border = header_border
+        cell.alignment = header_alignment
+        header.append(cell)
+    sheet.append(header)
+
+    # Missing values become empty cells, as with to_excel
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        sheet.append(row)
+
+    return f"A1:{get_column_letter(max(len(df.columns), 1))}{len(df) + 1}"
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _build_consolidated_excel(
+    _data: pd.DataFrame, data_version: str, display_columns: List[str]
+) -> bytes:
+    """Build the Overal + Consolidated workbook, cached on the session's
+    data_version (the frame itself is not hashed) and the exported columns
+
+    Written with a write-only openpyxl workbook: rows are streamed out as
+    they are appended instead of keeping a Cell object per value in memory.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    # Project to the exported columns once; both sheets reuse this view
+    export_df = _data[display_columns]
+
+    # Sheet 1: Overal - Detailed records (all consolidated data with all columns)
+    overal_sheet = workbook.create_sheet("Overal")
+    # Freeze the header row (sheet views go out before the first row)
+    overal_sheet.freeze_panes = "A2"
+    # Add AutoFilter to Overal sheet for easy filtering
+    overal_sheet.auto_filter.ref = _append_frame_rows(overal_sheet, export_df)
+
+    # Sheet 2: Consolidated - Summary by employee (ONE row per employee)
+    consolidated_sheet = workbook.create_sheet("Consolidated")
+    if "Name" in _data.columns and "Date" in _data.columns:
+        # Create consolidated summary - group by employee only (not by month)
+        temp_df = _data
+
+        # Build aggregation based on available columns
+        agg_dict = {
+            "Date": "count",  # Count of working days
+        }
+
+        if "Total Hours" in temp_df.columns:
+            agg_dict["Total Hours"] = "sum"
+
+        if "Overtime Hours (Decimal)" in temp_df.columns:
+            agg_dict["Overtime Hours (Decimal)"] = "sum"
+
+        # Group by Name only (not by month) - ONE row per employee
+        consolidated_summary = (
+            temp_df.groupby("Name", observed=True, sort=False)
+            .agg(agg_dict)
+            .reset_index()
+        )
+
+        # Rename columns
+        col_mapping = {
+            "Name": "EMPLOYEE NAME",
+            "Date": "Days Worked",
+        }
+        if "Total Hours" in agg_dict:
+            col_mapping["Total Hours"] = "Total Hours Worked"
+        if "Overtime Hours (Decimal)" in agg_dict:
+            col_mapping["Overtime Hours (Decimal)"] = "Total Overtime Hours"
+
+        consolidated_summary = consolidated_summary.rename(columns=col_mapping)
+
+        # Round hours to 2 decimal places
+        if "Total Hours Worked" in consolidated_summary.columns:
+            consolidated_summary["Total Hours Worked"] = consolidated_summary[
+                "Total Hours Worked"
+            ].round(2)
+        if "Total Overtime Hours" in consolidated_summary.columns:
+            consolidated_summary["Total Overtime Hours"] = consolidated_summary[
+                "Total Overtime Hours"
+            ].round(2)
+
+        # Add SN column
+        consolidated_summary.insert(0, "SN", range(1, len(consolidated_summary) + 1))
+
+        # Sort by employee name
+        consolidated_summary = consolidated_summary.sort_values(
+            "EMPLOYEE NAME"
+        ).reset_index(drop=True)
+        # Update SN after sorting
+        consolidated_summary["SN"] = range(1, len(consolidated_summary) + 1)
+
+        # Freeze the header row
+        consolidated_sheet.freeze_panes = "A2"
+        # Add AutoFilter to Consolidated sheet for easy filtering
+        consolidated_sheet.auto_filter.ref = _append_frame_rows(
+            consolidated_sheet, consolidated_summary
+        )
+    else:
+        # If we can't create monthly summary, just duplicate Overal sheet
+        _append_frame_rows(consolidated_sheet, export_df)
+
+    # Add Type of Work dropdown to Overal sheet if column exists
+    if "Type of Work" in display_columns:
+        from openpyxl.utils import get_column_letter
+        from openpyxl.worksheet.datavalidation import DataValidation
+
+        # Find Type of Work column
+        type_col_idx = None
+        for idx, col in enumerate(display_columns, start=1):
+            if col == "Type of Work":
+                type_col_idx = idx
+                break
+
+        if type_col_idx:
+            col_letter = get_column_letter(type_col_idx)
+            work_types = [
+                "Wagon",
+                "Superloader",
+                "Bulldozer/Superloader",
+                "Pump",
+                "Miller",
+            ]
+            formula_string = '"{}"'.format(",".join(work_types))
+
+            dv = DataValidation(
+                type="list",
+                formula1=formula_string,
+                allow_blank=True,
+                showDropDown=False,
+            )
+            dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
+            dv.errorTitle = "Invalid Entry"
+            dv.prompt = "Choose work type"
+            dv.promptTitle = "Type of Work Selection"
+
+            start_row = 2
+            end_row = len(_data) + 1
+            range_string = f"{col_letter}{start_row}:{col_letter}{end_row}"
+            dv.add(range_string)
+            # Validations are written after the rows, so adding it now is fine
+            overal_sheet.data_validations.append(dv)
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def _build_filtered_excel(filtered_df: pd.DataFrame, include_summary: bool) -> bytes:
+    """Build the filtered OT export workbook (Overal, Consolidated and optional
+    Summary sheets). Not cached: it only runs when an export is requested
+
+    Written with a write-only openpyxl workbook, like the consolidated export.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+
+    # Prepare data for export - remove Date_parsed if exists
+    export_df = filtered_df
+    if "Date_parsed" in export_df.columns:
+        export_df = export_df.drop(columns=["Date_parsed"])
+
+    # Sheet 1: Overal - Detailed filtered records
+    overal_sheet = workbook.create_sheet("Overal")
+    _append_frame_rows(overal_sheet, export_df)
+
+    consolidated_sheet = workbook.create_sheet("Consolidated")
+
+    # Sheet 2: Consolidated - Monthly summary by employee
+    if "EMPLOYEE NAME" in export_df.columns and "Date" in export_df.columns:
+        # Parse dates to get month
+        temp_df = export_df.copy(deep=False)
+        temp_df["Date_Parsed"] = pd.to_datetime(
+            temp_df["Date"], format="%d-%b-%Y", errors="coerce"
+        )
+        temp_df["Month"] = temp_df["Date_Parsed"].dt.to_period("M")
+
+        # Build aggregation dictionary
+        agg_dict = {
+            "Date": "count",  # Days worked
+        }
+
+        if "No. Hours" in temp_df.columns:
+            agg_dict["No. Hours"] = "sum"
+
+        if "Hrs at 1.5 rate" in temp_df.columns:
+            agg_dict["Hrs at 1.5 rate"] = "sum"
+
+        # Create consolidated summary
+        consolidated_summary = (
+            temp_df.groupby(["EMPLOYEE NAME", "Month"]).agg(agg_dict).reset_index()
+        )
+
+        # Rename columns appropriately
+        col_rename = {
+            "EMPLOYEE NAME": "EMPLOYEE NAME",
+            "Month": "Month",
+            "Date": "Days Worked",
+        }
+
+        if "No. Hours" in agg_dict:
+            col_rename["No. Hours"] = "Total Hours"
+
+        if "Hrs at 1.5 rate" in agg_dict:
+            col_rename["Hrs at 1.5 rate"] = "Total OT Hours"
+
+        consolidated_summary = consolidated_summary.rename(columns=col_rename)
+        consolidated_summary["Month"] = consolidated_summary["Month"].astype(str)
+
+        # Add SN column
+        consolidated_summary.insert(0, "SN", range(1, len(consolidated_summary) + 1))
+
+        _append_frame_rows(consolidated_sheet, consolidated_summary)
+    else:
+        # Fallback: duplicate Overal sheet
+        _append_frame_rows(consolidated_sheet, export_df)
+
+    # Add Type of Work dropdown to Overal sheet
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.datavalidation import DataValidation
+
+    # Find Type of Work column
+    try:
+        type_col_idx = list(export_df.columns).index("Type of Work") + 1
+        col_letter = get_column_letter(type_col_idx)
+
+        work_types = [
+            "Wagon",
+            "Superloader",
+            "Bulldozer/Superloader",
+            "Pump",
+            "Miller",
+        ]
+        formula_string = '"{}"'.format(",".join(work_types))
+
+        dv = DataValidation(
+            type="list",
+            formula1=formula_string,
+            showDropDown=False,
+            allow_blank=True,
+        )
+        dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
+        dv.errorTitle = "Invalid Entry"
+        dv.prompt = "Choose work type"
+        dv.promptTitle = "Type of Work Selection"
+
+        # Apply to all data rows
+        start_row = 2
+        end_row = len(export_df) + 1
+        range_string = f"{col_letter}{start_row}:{col_letter}{end_row}"
+        dv.add(range_string)
+        # Validations are written after the rows, so adding it now is fine
+        overal_sheet.data_validations.append(dv)
+    except Exception as e:
+        st.warning(f"Could not add Type of Work dropdown: {e}")
+
+    # Sheet 3: Summary - Additional analytics by employee (if requested)
+    if include_summary:
+        summary_df = (
+            export_df.groupby("EMPLOYEE NAME")
+            .agg(
+                {
+                    "SN": "count",
+                    "Hrs at 1.5 rate": "sum",
+                    "Date": lambda x: ", ".join(sorted(set(x))),
+                }
+            )
+            .reset_index()
+        )
+
+        summary_df.columns = [
+            "Employee Name",
+            "Number of Shifts",
+            "Total OT Hours",
+            "Dates Worked",
+        ]
+        summary_df.insert(0, "SN", range(1, len(summary_df) + 1))
+
+        _append_frame_rows(workbook.create_sheet("Summary"), summary_df)
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def _ot_management_excel_bytes(
+    overal_df: pd.DataFrame, consolidated_df: pd.DataFrame
+) -> bytes:
+    """Write the converted OT Management workbook (Overal with the Type of
+    Work dropdown, plus Consolidated) to .xlsx bytes
+
+    Written with a write-only openpyxl workbook, like the other OT exports.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    overal_sheet = workbook.create_sheet("Overal")
+    _append_frame_rows(overal_sheet, overal_df)
+    _append_frame_rows(workbook.create_sheet("Consolidated"), consolidated_df)
+
+    # Add dropdown to "Type of Work" column in Overal sheet
+    if "Type of Work" in overal_df.columns:
+        from openpyxl.utils import get_column_letter
+        from openpyxl.worksheet.datavalidation import DataValidation
+
+        col_letter = get_column_letter(overal_df.columns.get_loc("Type of Work") + 1)
+
+        # Define dropdown options - use proper Excel list format
+        work_types = [
+            "Wagon",
+            "Superloader",
+            "Bulldozer/Superloader",
+            "Pump",
+            "Miller",
+        ]
+        formula_string = '"{}"'.format(",".join(work_types))
+
+        dv = DataValidation(
+            type="list",
+            formula1=formula_string,
+            allow_blank=True,
+            showDropDown=False,  # Show dropdown arrow
+        )
+        dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
+        dv.errorTitle = "Invalid Entry"
+        dv.prompt = (
+            "Choose work type: Wagon, Superloader, Bulldozer/Superloader, Pump, Miller"
+        )
+        dv.promptTitle = "Type of Work Selection"
+
+        # Apply to all data rows (excluding header)
+        dv.add(f"{col_letter}2:{col_letter}{len(overal_df) + 1}")
+        overal_sheet.data_validations.append(dv)
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _employee_stats(_data: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    """Per-employee totals for the results analytics, cached on the session's
+    data_version (the frame itself is not hashed)"""
+    agg_dict = {"Total Hours": "sum", "Date": "count"}
+    col_names = ["Employee", "Total Hours", "Days Worked"]
+
+    if "Overtime Hours (Decimal)" in _data.columns:
+        agg_dict["Overtime Hours (Decimal)"] = "sum"
+        col_names.insert(2, "Overtime Hours (Decimal)")
+
+    employee_stats = _data.groupby("Name", observed=True).agg(agg_dict).reset_index()
+    employee_stats.columns = col_names
+
+    # Format overtime hours for display if available
+    if "Overtime Hours (Decimal)" in employee_stats.columns:
+        processor = TimesheetProcessor()
+        employee_stats["Overtime Hours"] = processor.format_hours_to_time_vectorized(
+            employee_stats["Overtime Hours (Decimal)"]
+        )
+    return employee_stats
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _daily_stats(_data: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    """Per-date totals for the results analytics, cached on the session's
+    data_version (the frame itself is not hashed)"""
+    # Build aggregation dictionary based on available columns
+    agg_dict = {
+        "Total Hours": "sum",
+        "Name": "count",
+    }
+    if "Overtime Hours (Decimal)" in _data.columns:
+        agg_dict["Overtime Hours (Decimal)"] = "sum"
+
+    date_parsed = pd.to_datetime(_data["Date"], format="%d-%b-%Y")
+    daily_stats = _data.groupby(date_parsed).agg(agg_dict).reset_index()
+
+    # Rename columns based on what we have
+    if "Overtime Hours (Decimal)" in _data.columns:
+        daily_stats.columns = [
+            "Date",
+            "Total Hours",
+            "Employees",
+            "Overtime Hours (Decimal)",
+        ]
+        # Format overtime hours for display
+        processor = TimesheetProcessor()
+        daily_stats["Overtime Hours"] = processor.format_hours_to_time_vectorized(
+            daily_stats["Overtime Hours (Decimal)"]
+        )
+    else:
+        daily_stats.columns = [
+            "Date",
+            "Total Hours",
+            "Employees",
+        ]
+    return daily_stats
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _shift_distribution_pie(shift_counts: pd.Series):
+    """Shift distribution pie for the results analytics, cached on the counts"""
+    import plotly.express as px
+
+    return px.pie(
+        values=shift_counts.values,
+        names=shift_counts.index,
+        title="🎯 Shift Distribution",
+        color_discrete_sequence=["#1f77b4", "#ff7f0e"],
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _top_employees_bar(top_10: pd.DataFrame):
+    """Top-10 employees bar for the results analytics, cached on its rows"""
+    import plotly.express as px
+
+    fig = px.bar(
+        top_10,
+        x="Employee",
+        y="Total Hours",
+        title="🏆 Top 10 Employees by Total Hours",
+        color="Total Hours",
+        color_continuous_scale="Blues",
+    )
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _daily_hours_line(daily_stats: pd.DataFrame):
+    """Daily total hours trend for the results analytics, cached on its rows"""
+    import plotly.express as px
+
+    return px.line(
+        daily_stats,
+        x="Date",
+        y="Total Hours",
+        title="📅 Daily Total Hours Trend",
+        markers=True,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _overtime_distribution_bar(ot_counts: pd.Series):
+    """Overtime hours distribution for the results analytics, cached on the
+    per-label counts"""
+    import plotly.graph_objects as go
+
+    # HH:MM:SS labels are categories: plain bars, no plotly express pipeline
+    fig = go.Figure(
+        go.Bar(x=ot_counts.index, y=ot_counts.to_numpy(), marker_color="#ff7f0e")
+    )
+    fig.update_layout(
+        title="💼 Overtime Hours Distribution",
+        xaxis_title="Overtime Hours",
+        yaxis_title="count",
+        bargap=0,
+    )
+    return fig
+
+
 # ----------------- Attendance Conversion Utilities -----------------
 def parse_attendance_time(value: Any, col_name: str = "") -> Optional[time]:
     """Smart parser for time-like values in attendance sheets"""
@@ -1354,6 +2212,28 @@ def decimal_hours_to_hms(decimal_hours: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+def decimal_hours_series_to_hms(values) -> pd.Series:
+    """Vectorized decimal_hours_to_hms over a whole column
+
+    Args:
+        values: Series or array of decimal hours
+
+    Returns:
+        Series of HH:MM:SS strings ("00:00:00" for 0/NaN)
+    """
+    values = pd.Series(values, dtype=float)
+    total_seconds = np.trunc(values.fillna(0).to_numpy() * 3600).astype(np.int64)
+    hours, minutes, seconds = (
+        pd.Series(part, index=values.index).astype(str).str.zfill(2)
+        for part in (
+            total_seconds // 3600,
+            (total_seconds % 3600) // 60,
+            total_seconds % 60,
+        )
+    )
+    return hours + ":" + minutes + ":" + seconds
+
+
 def hms_to_decimal_hours(hms_str: str) -> float:
     """Convert HH:MM:SS format to decimal hours
 
@@ -1377,6 +2257,41 @@ def hms_to_decimal_hours(hms_str: str) -> float:
         return 0.0
 
 
+def hms_series_to_decimal_hours(values: pd.Series) -> pd.Series:
+    """Vectorized hms_to_decimal_hours over a whole column
+
+    Args:
+        values: Series of HH:MM:SS (or HH:MM) strings / time objects
+
+    Returns:
+        Series of decimal hours, 0.0 where the value is blank or unparseable
+    """
+    parts = (
+        values.astype(str)
+        .str.split(":", expand=True)
+        .reindex(columns=range(3))
+        .astype("string")
+    )
+
+    # Only plain integers are accepted per part, as with int() in the scalar version
+    hours, minutes, seconds = (
+        pd.to_numeric(
+            part.where(part.str.fullmatch(r"\s*[+-]?\d+\s*", na=False)),
+            errors="coerce",
+        )
+        for part in (parts[0], parts[1], parts[2])
+    )
+    valid = (
+        values.notna()
+        & hours.notna()
+        & minutes.notna()
+        & (seconds.notna() | parts[2].isna())
+    )
+
+    decimal_hours = hours + (minutes / 60.0) + (seconds.fillna(0) / 3600.0)
+    return decimal_hours.where(valid, 0.0).astype(float)
+
+
 def detect_attendance_columns(df: pd.DataFrame) -> Dict[str, Any]:
     """Try to detect which columns represent name, date, check-in, check-out, department."""
     cols = [c.lower() for c in df.columns]
@@ -1462,6 +2377,10 @@ def convert_attendance_to_overtime(
     from datetime import date as _date
 
     overal_records = []
+    # Positions of complete check-in/check-out pairs and their clock minutes
+    paired_rows = []
+    start_minutes = []
+    end_minutes = []
 
     name_col = column_mapping["name_col"]
     date_col = column_mapping["date_col"]
@@ -1469,131 +2388,106 @@ def convert_attendance_to_overtime(
     checkout_col = column_mapping["checkout_col"]
     dept_col = column_mapping.get("dept_col")
 
-    for idx, row in attendance_df.iterrows():
+    # Iterate plain column lists instead of iterrows(), which builds a Series
+    # per row; only the mapped columns are read
+    n_rows = len(attendance_df)
+    row_values = zip(
+        attendance_df[name_col].tolist(),
+        attendance_df[date_col].tolist(),
+        attendance_df[checkin_col].tolist(),
+        attendance_df[checkout_col].tolist(),
+        attendance_df[dept_col].tolist() if dept_col else [None] * n_rows,
+    )
+
+    for name, date_str, checkin_value, checkout_value, dept in row_values:
+        job_title = dept if dept_col else "Operator"
+        department = dept if dept_col else ""
         try:
-            date_str = row[date_col]
             # Try parsing date with pandas - use dayfirst=True for dd/mm/yyyy format
             date_obj = pd.to_datetime(date_str, errors="coerce", dayfirst=True)
             # Check if date parsing failed
             if pd.isna(date_obj):  # type: ignore
                 continue
 
-            check_in_time = parse_attendance_time(row[checkin_col], checkin_col)
-            check_out_time = parse_attendance_time(row[checkout_col], checkout_col)
+            check_in_time = parse_attendance_time(checkin_value, checkin_col)
+            check_out_time = parse_attendance_time(checkout_value, checkout_col)
 
             # HANDLE MISSING DATA - DON'T SKIP, MARK AS N/A
             if check_in_time is None and check_out_time is None:
                 # Both missing - still record it
-                date_formatted = date_obj.strftime("%d-%b-%Y") if not pd.isna(date_obj) else "N/A"  # type: ignore
                 overal_record = {
                     "SN": len(overal_records) + 1,
-                    "EMPLOYEE NAME": row[name_col],
-                    "JOB TITLE": (
-                        row.get(dept_col, "Operator") if dept_col else "Operator"
-                    ),
-                    "Date": date_formatted,
+                    "EMPLOYEE NAME": name,
+                    "JOB TITLE": job_title,
+                    "Date": date_obj,
                     "Start time": "N/A",
                     "End time": "N/A",
                     "No. Hours": "00:00:00",
-                    "Hrs at 1.5 rate": 0,
+                    "Hrs at 1.5 rate": 0.0,
                     "Type of Work": "Wagon",
                     "Direct Supervisor": "",
-                    "Department": row.get(dept_col, "") if dept_col else "",
+                    "Department": department,
                 }
                 overal_records.append(overal_record)
                 continue
 
             elif check_in_time is None:
                 # Missing check-in only
-                date_formatted = date_obj.strftime("%d-%b-%Y") if not pd.isna(date_obj) else "N/A"  # type: ignore
                 end_time_str = (
                     check_out_time.strftime("%H:%M") if check_out_time else "N/A"
                 )
                 overal_record = {
                     "SN": len(overal_records) + 1,
-                    "EMPLOYEE NAME": row[name_col],
-                    "JOB TITLE": (
-                        row.get(dept_col, "Operator") if dept_col else "Operator"
-                    ),
-                    "Date": date_formatted,
+                    "EMPLOYEE NAME": name,
+                    "JOB TITLE": job_title,
+                    "Date": date_obj,
                     "Start time": "N/A",
                     "End time": end_time_str,
                     "No. Hours": "00:00:00",
-                    "Hrs at 1.5 rate": 0,
+                    "Hrs at 1.5 rate": 0.0,
                     "Type of Work": "Wagon",
                     "Direct Supervisor": "",
-                    "Department": row.get(dept_col, "") if dept_col else "",
+                    "Department": department,
                 }
                 overal_records.append(overal_record)
                 continue
 
             elif check_out_time is None:
                 # Missing check-out only
-                date_formatted = date_obj.strftime("%d-%b-%Y") if not pd.isna(date_obj) else "N/A"  # type: ignore
                 overal_record = {
                     "SN": len(overal_records) + 1,
-                    "EMPLOYEE NAME": row[name_col],
-                    "JOB TITLE": (
-                        row.get(dept_col, "Operator") if dept_col else "Operator"
-                    ),
-                    "Date": date_formatted,
+                    "EMPLOYEE NAME": name,
+                    "JOB TITLE": job_title,
+                    "Date": date_obj,
                     "Start time": check_in_time.strftime("%H:%M"),
                     "End time": "N/A",
                     "No. Hours": "00:00:00",
-                    "Hrs at 1.5 rate": 0,
+                    "Hrs at 1.5 rate": 0.0,
                     "Type of Work": "Wagon",
                     "Direct Supervisor": "",
-                    "Department": row.get(dept_col, "") if dept_col else "",
+                    "Department": department,
                 }
                 overal_records.append(overal_record)
                 continue
 
-            # Determine shift and calculate hours
-            # Use same logic as backup: simple day/night threshold at 18:00
-            shift_type = "Day Shift" if check_in_time < time(18, 0) else "Night Shift"
-
-            # Calculate total hours
-            start_minutes = check_in_time.hour * 60 + check_in_time.minute
-            end_minutes = check_out_time.hour * 60 + check_out_time.minute
-            if end_minutes < start_minutes:
-                end_minutes += 24 * 60
-            total_hours = round((end_minutes - start_minutes) / 60.0, 2)
-
-            # Calculate overtime using existing rules (day: after 17:00, night: after 3:00)
-            # Day shift overtime
-            overtime_hours = 0.0
-            if shift_type == "Day Shift":
-                if check_out_time.hour >= 17:
-                    overtime_hours = max(0.0, (end_minutes - (17 * 60)) / 60.0)
-                    if overtime_hours < 0.5:
-                        overtime_hours = 0.0
-                    overtime_hours = min(overtime_hours, 1.5)
-            else:
-                # Night shift - overtime after 03:00 (next day). Convert to minutes after midnight
-                if check_out_time.hour <= 12:
-                    minutes_after_midnight = (
-                        check_out_time.hour * 60 + check_out_time.minute
-                    )
-                    overtime_hours = max(
-                        0.0, (minutes_after_midnight - (3 * 60)) / 60.0
-                    )
-                    if overtime_hours < 0.5:
-                        overtime_hours = 0.0
-                    overtime_hours = min(overtime_hours, 3.0)
+            # Hours and overtime for complete pairs are computed for all rows
+            # at once after the loop; only the clock minutes are kept here
+            paired_rows.append(len(overal_records))
+            start_minutes.append(check_in_time.hour * 60 + check_in_time.minute)
+            end_minutes.append(check_out_time.hour * 60 + check_out_time.minute)
 
-            date_formatted = date_obj.strftime("%d-%b-%Y") if not pd.isna(date_obj) else "N/A"  # type: ignore
             overal_record = {
                 "SN": len(overal_records) + 1,
-                "EMPLOYEE NAME": row[name_col],
-                "JOB TITLE": row.get(dept_col, "Operator") if dept_col else "Operator",
-                "Date": date_formatted,
+                "EMPLOYEE NAME": name,
+                "JOB TITLE": job_title,
+                "Date": date_obj,
                 "Start time": check_in_time.strftime("%H:%M"),
                 "End time": check_out_time.strftime("%H:%M"),
-                "No. Hours": decimal_hours_to_hms(total_hours),
-                "Hrs at 1.5 rate": round(overtime_hours, 2),
+                "No. Hours": "00:00:00",
+                "Hrs at 1.5 rate": 0.0,
                 "Type of Work": "Wagon",
                 "Direct Supervisor": "",
-                "Department": row.get(dept_col, "") if dept_col else "",
+                "Department": department,
             }
 
             overal_records.append(overal_record)
@@ -1603,20 +2497,49 @@ def convert_attendance_to_overtime(
 
     overal_df = pd.DataFrame(overal_records)
 
+    if not overal_df.empty:
+        # Work dates are formatted for all records in one pass
+        overal_df["Date"] = pd.to_datetime(overal_df["Date"]).dt.strftime("%d-%b-%Y")
+
+    if paired_rows:
+        start = np.array(start_minutes)
+        end = np.array(end_minutes)
+        # Simple day/night threshold at 18:00; checkouts before the check-in
+        # are on the next day
+        night = start >= 18 * 60
+        end_total = np.where(end < start, end + 24 * 60, end)
+        total_hours = np.round((end_total - start) / 60.0, 2)
+
+        # Overtime rules - day: after 17:00 (checkout hour >= 17), max 1.5h;
+        # night: after 03:00 on a checkout up to 12:59, max 3h; < 30 min = none
+        overtime_hours = np.where(
+            night,
+            np.where(end < 13 * 60, np.maximum(0.0, (end - 3 * 60) / 60.0), 0.0),
+            np.where(
+                end >= 17 * 60, np.maximum(0.0, (end_total - 17 * 60) / 60.0), 0.0
+            ),
+        )
+        overtime_hours = np.where(overtime_hours < 0.5, 0.0, overtime_hours)
+        overtime_hours = np.minimum(overtime_hours, np.where(night, 3.0, 1.5))
+
+        hours_col = overal_df["No. Hours"].to_numpy(dtype=object, copy=True)
+        hours_col[paired_rows] = decimal_hours_series_to_hms(total_hours).to_numpy()
+        overtime_col = overal_df["Hrs at 1.5 rate"].to_numpy(dtype=float, copy=True)
+        overtime_col[paired_rows] = np.round(overtime_hours, 2)
+        overal_df["No. Hours"] = hours_col
+        overal_df["Hrs at 1.5 rate"] = overtime_col
+
     # Build consolidated pivot
     if not overal_df.empty:
         overal_df["Date_Parsed"] = pd.to_datetime(overal_df["Date"], format="%d-%b-%Y")
         overal_df["Month"] = overal_df["Date_Parsed"].dt.to_period("M")
 
-        monthly_summary = (
-            overal_df.groupby(["EMPLOYEE NAME", "Month"])["Hrs at 1.5 rate"]
-            .sum()
-            .reset_index()
-        )
+        monthly_summary = overal_df.groupby(["EMPLOYEE NAME", "Month"], observed=True)[
+            "Hrs at 1.5 rate"
+        ].sum()
 
-        consolidated_pivot = monthly_summary.pivot(
-            index="EMPLOYEE NAME", columns="Month", values="Hrs at 1.5 rate"
-        ).fillna(0)
+        # Employee/month gaps are filled with 0 during the reshape itself
+        consolidated_pivot = monthly_summary.unstack("Month", fill_value=0)
         consolidated_pivot.columns = [
             f"{col.to_timestamp().strftime('%b-%y')}"  # type: ignore
             for col in consolidated_pivot.columns
@@ -1638,210 +2561,30 @@ def convert_attendance_to_overtime(
     return overal_df, consolidated_df
 
 
-def _cli_process_attendance_file(path: str):
-    """Helper to allow quick local processing of attendance files for verification."""
-    df = None
-    if path.lower().endswith(".csv"):
-        df = pd.read_csv(path)
-    else:
-        df = pd.read_excel(path)
-
-    mapping = detect_attendance_columns(df)
-    if mapping["error"]:
-        print("Column detection failed:", mapping["error"])
-        print("Detected columns:", df.columns.tolist())
-        return
-
-    overal_df, consolidated_df = convert_attendance_to_overtime(df, mapping)
-    out_dir = Path("data/output")
-    out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / (Path(path).stem + "_processed.xlsx")
-
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-        overal_df.to_excel(writer, sheet_name="Overal", index=False)
-        consolidated_df.to_excel(writer, sheet_name="Consolidated", index=False)
-
-    print(f"Wrote {out_path}")
-
-    def consolidate_timesheet_data(self, df, show_warnings=True) -> pd.DataFrame:
-        """Master function to consolidate timesheet data and apply business rules
-        ENSURES ALL EMPLOYEES APPEAR FOR ALL WORKING DAYS FROM DAY 1 TO END OF MONTH
-
-        Args:
-            df: DataFrame with timesheet data
-            show_warnings: Whether to display estimation warnings for missing check-in/out data
-        """
-
-        # Make a copy and clean unnecessary columns
-        df_work = df.copy()
-        unnecessary_cols = [col for col in df_work.columns if "Unnamed" in col]
-        for col in unnecessary_cols:
-            df_work = df_work.drop(col, axis=1)
-
-        # Parse Date and Time - handle both inline and separate formats
-        if "Date/Time" in df_work.columns:
-            # Handle inline Date/Time format like "01/08/2025 06:43:19"
-            st.info("🔄 Processing inline Date/Time format...")
-            df_work[["Date_parsed", "Time_parsed"]] = df_work.apply(
-                lambda row: pd.Series(self.parse_inline_datetime(row["Date/Time"])),
-                axis=1,
-            )
-        else:
-            # Handle separate Date and Time columns
-            df_work[["Date_parsed", "Time_parsed"]] = df_work.apply(
-                lambda row: pd.Series(self.parse_date_time(row["Date"], row["Time"])),
-                axis=1,
-            )
-
-        # Remove rows where parsing failed
-        initial_count = len(df_work)
-        df_work = df_work[df_work["Date_parsed"].notna()]
-        df_work = df_work[df_work["Time_parsed"].notna()]
-
-        st.info(
-            f"📊 Processing {len(df_work)} valid records from {initial_count} total records"
-        )
-
-        # Progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-
-        # Process only actual employee-date combinations (not artificial ones)
-        consolidated_rows = []
-        employee_dates = df_work.groupby(["Name", "Date_parsed"])
-        total_combinations = len(employee_dates)
-        processed_combinations = 0
-
-        for (employee, date), day_data in employee_dates:
-            # Get start and end times for this employee on this date
-            start_time, end_time = self.find_first_checkin_last_checkout(day_data)
-
-            if start_time and end_time:
-                # Complete shift data available
-                shift_type = self.determine_shift_type(start_time)
-                total_hours = self.calculate_total_work_hours(
-                    start_time, end_time, shift_type, date
-                )
-                overtime_hours = self.calculate_overtime_hours(
-                    start_time, end_time, shift_type, date
-                )
-                entry_details = ", ".join(
-                    [
-                        f"{row['Time']}({row['Status']})"
-                        for _, row in day_data.iterrows()
-                    ]
-                )
-            elif start_time and not end_time:
-                # Missing check-out - estimate 8 hours later
-                end_time = (
-                    datetime.combine(date, start_time) + timedelta(hours=8)
-                ).time()
-                if show_warnings:
-                    st.warning(
-                        f"⚠️ Missing check-out for {employee} on {date.strftime('%d/%m/%Y')} - estimated"
-                    )
-                shift_type = self.determine_shift_type(start_time)
-                total_hours = self.calculate_total_work_hours(
-                    start_time, end_time, shift_type, date
-                )
-                overtime_hours = self.calculate_overtime_hours(
-                    start_time, end_time, shift_type, date
-                )
-                entry_details = "Estimated checkout - " + ", ".join(
-                    [
-                        f"{row['Time']}({row['Status']})"
-                        for _, row in day_data.iterrows()
-                    ]
-                )
-            elif end_time and not start_time:
-                # Missing check-in - estimate 8 hours before
-                start_time = (
-                    datetime.combine(date, end_time) - timedelta(hours=8)
-                ).time()
-                if show_warnings:
-                    st.warning(
-                        f"⚠️ Missing check-in for {employee} on {date.strftime('%d/%m/%Y')} - estimated"
-                    )
-                shift_type = self.determine_shift_type(start_time)
-                total_hours = self.calculate_total_work_hours(
-                    start_time, end_time, shift_type, date
-                )
-                overtime_hours = self.calculate_overtime_hours(
-                    start_time, end_time, shift_type, date
-                )
-                entry_details = "Estimated checkin - " + ", ".join(
-                    [
-                        f"{row['Time']}({row['Status']})"
-                        for _, row in day_data.iterrows()
-                    ]
-                )
-            else:
-                # Skip this entry if no valid times found
-                processed_combinations += 1
-                progress = processed_combinations / total_combinations
-                progress_bar.progress(progress)
-                status_text.text(
-                    f"Skipping: {employee} - {date.strftime('%d-%b-%Y')} (no valid times)"
-                )
-                continue
-
-            consolidated_row = {
-                "Name": employee,
-                "Date": date.strftime("%d-%b-%Y"),
-                "Start Time": (
-                    start_time.strftime("%H:%M:%S") if start_time else "No Data"
-                ),
-                "End Time": end_time.strftime("%H:%M:%S") if end_time else "No Data",
-                "Total Hours": total_hours,
-                "Overtime Hours": self.format_hours_to_time(overtime_hours),
-                "Overtime Hours (Decimal)": overtime_hours,  # Keep decimal version for calculations
-                "Original Entries": len(day_data),
-                "Entry Details": entry_details,
-            }
-
-            consolidated_rows.append(consolidated_row)
-
-            processed_combinations += 1
-            progress = processed_combinations / total_combinations
-            progress_bar.progress(progress)
-            status_text.text(
-                f"Processing: {employee} - {date.strftime('%d/%m/%Y')} ({processed_combinations}/{total_combinations})"
-            )
-
-        progress_bar.empty()
-        status_text.empty()
-
-        consolidated_df = pd.DataFrame(consolidated_rows)
-
-        # Check if DataFrame is empty or missing required columns
-        if consolidated_df.empty:
-            st.warning(
-                "⚠️ No records were consolidated. Please check if the data has valid check-in/check-out pairs."
-            )
-            return consolidated_df
+def _cli_process_attendance_file(path: str):
+    """Helper to allow quick local processing of attendance files for verification."""
+    df = None
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_excel(path)
 
-        if (
-            "Name" not in consolidated_df.columns
-            or "Date" not in consolidated_df.columns
-        ):
-            st.error(
-                f"❌ Missing required columns after consolidation. Available columns: {consolidated_df.columns.tolist()}"
-            )
-            return consolidated_df
+    mapping = detect_attendance_columns(df)
+    if mapping["error"]:
+        print("Column detection failed:", mapping["error"])
+        print("Detected columns:", df.columns.tolist())
+        return
 
-        # Sort by Name and Date (chronologically, not alphabetically)
-        # Convert Date string to datetime for proper sorting
-        consolidated_df["_sort_date"] = pd.to_datetime(
-            consolidated_df["Date"], format="%d-%b-%Y"
-        )
-        consolidated_df = consolidated_df.sort_values(["Name", "_sort_date"])
-        consolidated_df = consolidated_df.drop(columns=["_sort_date"])
+    overal_df, consolidated_df = convert_attendance_to_overtime(df, mapping)
+    out_dir = Path("data/output")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / (Path(path).stem + "_processed.xlsx")
 
-        st.success(
-            f"✅ Successfully processed {len(consolidated_df)} actual work records!"
-        )
+    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+        overal_df.to_excel(writer, sheet_name="Overal", index=False)
+        consolidated_df.to_excel(writer, sheet_name="Consolidated", index=False)
 
-        return consolidated_df
+    print(f"Wrote {out_path}")
 
 
 # ==================== TESTING INFRASTRUCTURE FUNCTIONS ====================
@@ -1967,8 +2710,8 @@ def display_integration_tests_tab():
             st.success(f"Generated {len(test_data)} test records")
             st.dataframe(test_data.head(10), width="stretch")
 
-            # Download test data
-            csv = test_data.to_csv(index=False)
+            # Download test data (fresh random data each click, so not cached)
+            csv = _csv_bytes(test_data)
             st.download_button(
                 "💾 Download Test Data",
                 csv,
@@ -2042,6 +2785,7 @@ def display_performance_tests_tab():
 
         if PSUTIL_AVAILABLE:
             try:
+                import plotly.express as px
                 import psutil
 
                 cpu_count = psutil.cpu_count()
@@ -2276,56 +3020,96 @@ def run_unit_tests():
 
 def generate_test_timesheet_data(num_employees, num_days):
     """Generate test timesheet data"""
-    data = []
+    # Local bindings avoid repeated attribute lookups inside the hot loop
+    rand = random.random
+    randint = random.randint
+
+    # Accumulate plain column lists and build the DataFrame once
+    dates_arr = []
+    times_arr = []
+    status_arr = []
+    names_arr = []
 
     for emp_id in range(1, num_employees + 1):
+        emp_name = f"Employee_{emp_id:03d}"
+
         for day in range(1, num_days + 1):
             date_str = f"2025-01-{day:02d}"
-            emp_name = f"Employee_{emp_id:03d}"
 
             # Generate random shift
-            if random.random() < 0.7:  # 70% day shift
-                start_hour = random.randint(7, 9)
-                end_hour = random.randint(16, 19)
-
-                data.extend(
-                    [
-                        {
-                            "Date": date_str,
-                            "Time": f"{start_hour:02d}:{random.randint(0, 59):02d}:00",
-                            "Status": "C/In",
-                            "Name": emp_name,
-                        },
-                        {
-                            "Date": date_str,
-                            "Time": f"{end_hour:02d}:{random.randint(0, 59):02d}:00",
-                            "Status": "C/Out",
-                            "Name": emp_name,
-                        },
-                    ]
-                )
+            if rand() < 0.7:  # 70% day shift
+                start_hour = randint(7, 9)
+                end_hour = randint(16, 19)
+                in_status, out_status = "C/In", "C/Out"
             else:  # 30% night shift
-                start_hour = random.randint(18, 20)
-                end_hour = random.randint(2, 6)
+                start_hour = randint(18, 20)
+                end_hour = randint(2, 6)
+                in_status, out_status = "OverTime In", "OverTime Out"
+
+            dates_arr.append(date_str)
+            times_arr.append(f"{start_hour:02d}:{randint(0, 59):02d}:00")
+            status_arr.append(in_status)
+            names_arr.append(emp_name)
+
+            dates_arr.append(date_str)
+            times_arr.append(f"{end_hour:02d}:{randint(0, 59):02d}:00")
+            status_arr.append(out_status)
+            names_arr.append(emp_name)
+
+    return pd.DataFrame(
+        {
+            "Date": dates_arr,
+            "Time": times_arr,
+            "Status": status_arr,
+            "Name": names_arr,
+        }
+    )
 
-                data.extend(
-                    [
-                        {
-                            "Date": date_str,
-                            "Time": f"{start_hour:02d}:{random.randint(0, 59):02d}:00",
-                            "Status": "OverTime In",
-                            "Name": emp_name,
-                        },
-                        {
-                            "Date": date_str,
-                            "Time": f"{end_hour:02d}:{random.randint(0, 59):02d}:00",
-                            "Status": "OverTime Out",
-                            "Name": emp_name,
-                        },
-                    ]
-                )
 
-    return pd.DataFrame(data)
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _overview_stats(_df: pd.DataFrame, raw_version: str) -> Tuple[int, int, int, int]:
+    """Return (records, unique employees, unique dates, columns) for the
+    overview, cached on the loaded file's version (the frame is not hashed)"""
+    return (
+        len(_df),
+        int(_df["Name"].nunique()),
+        # Blank dates count as one value, like len(unique())
+        int(_df["Date"].nunique(dropna=False)),
+        len(_df.columns),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _entry_count_stats(
+    _df: pd.DataFrame, raw_version: str
+) -> Tuple[int, int, np.ndarray, np.ndarray]:
+    """Return (employee-days, employee-days with multiple entries, entries per
+    day, number of employee-days) for the duplicate entry analysis, cached on
+    the loaded file's version (the frame is not hashed)"""
+    # Entry counts per employee-day as a plain Series (no reset_index frame)
+    entry_count = _df.groupby(["Name", "Date"], observed=True, sort=False).size()
+
+    # Entry counts are small positive ints - bincount avoids hashing/sorting
+    entry_hist = np.bincount(entry_count.to_numpy())
+    entry_counts = np.nonzero(entry_hist)[0]
+    return (
+        len(entry_count),
+        int((entry_count > 1).sum()),
+        entry_counts,
+        entry_hist[entry_counts],
+    )
+
+
+def _factorize_dates(
+    dates: pd.Series, date_format: str
+) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """Parse a repetitive date-string column once per distinct value
+
+    Returns (codes, parsed uniques): row i's date is uniques[codes[i]], so
+    filters compare the few uniques and select rows by code.
+    """
+    codes, uniques = pd.factorize(dates)
+    return codes, pd.to_datetime(uniques, format=date_format)
 
 
 def create_dashboard():
@@ -2413,6 +3197,9 @@ def create_dashboard():
         # Main Content Area - Timesheet Processing
         raw_data = None
         file_source = ""
+        # Content key for the loaded file: the per-dataset caches below are
+        # keyed on it instead of hashing the frame on every rerun
+        raw_version = ""
 
         # Check for auto-loaded file
         if "auto_load_file" in st.session_state:
@@ -2422,6 +3209,8 @@ def create_dashboard():
             with st.spinner("Loading timesheet data..."):
                 raw_data = processor.load_file_from_disk(file_path)
             file_source = f"Auto-loaded: {os.path.basename(file_path)}"
+            if raw_data is not None:
+                raw_version = f"{file_path}:{os.path.getmtime(file_path)}"
 
             # Clear the auto-load flag
             del st.session_state["auto_load_file"]
@@ -2433,64 +3222,59 @@ def create_dashboard():
             with st.spinner("Loading timesheet data..."):
                 raw_data = processor.load_timesheet_file(uploaded_file)
             file_source = f"Uploaded: {uploaded_file.name}"
+            raw_version = hashlib.sha1(uploaded_file.getvalue()).hexdigest()
 
         if raw_data is not None:
             # Display file source
             st.success(f"✅ Successfully loaded: {file_source}")
 
-            # File Overview
+            # File Overview (cached per file so reruns skip the nunique passes)
+            total_records, unique_employees, unique_dates, total_columns = (
+                _overview_stats(raw_data, raw_version)
+            )
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("📄 Total Records", f"{len(raw_data):,}")
+                st.metric("📄 Total Records", f"{total_records:,}")
             with col2:
-                st.metric("👥 Unique Employees", raw_data["Name"].nunique())
+                st.metric("👥 Unique Employees", unique_employees)
             with col3:
-                st.metric("📅 Date Range", f"{len(raw_data['Date'].unique())} days")
+                st.metric("📅 Date Range", f"{unique_dates} days")
             with col4:
-                st.metric("🔢 Columns", len(raw_data.columns))
+                st.metric("🔢 Columns", total_columns)
 
-            # Show sample data
+            # Show sample data - a fixed 10-row view needs no interactive grid
             st.subheader("📋 Sample Data")
-            st.dataframe(
-                raw_data[["Name", "Date", "Time", "Status"]].head(10), width="stretch"
-            )
+            st.table(raw_data[["Name", "Date", "Time", "Status"]].head(10))
 
             # Duplicate Analysis
             st.subheader("🔍 Duplicate Entry Analysis")
 
-            duplicate_analysis = (
-                raw_data.groupby(["Name", "Date"])
-                .size()
-                .reset_index(name="Entry_Count")
+            # Computed once per loaded file, not on every rerun
+            combination_count, multiple_count, entry_counts, entry_freqs = (
+                _entry_count_stats(raw_data, raw_version)
             )
-            multiple_entries = duplicate_analysis[duplicate_analysis["Entry_Count"] > 1]
 
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric(
-                    "📊 Employee-Date Combinations", f"{len(duplicate_analysis):,}"
-                )
+                st.metric("📊 Employee-Date Combinations", f"{combination_count:,}")
             with col2:
-                st.metric("🔄 With Multiple Entries", f"{len(multiple_entries):,}")
+                st.metric("🔄 With Multiple Entries", f"{multiple_count:,}")
             with col3:
-                duplicate_pct = len(multiple_entries) / len(duplicate_analysis) * 100
+                duplicate_pct = multiple_count / combination_count * 100
                 st.metric("📈 Duplicate Percentage", f"{duplicate_pct:.1f}%")
 
-            # Entry Distribution Chart
-            entry_distribution = (
-                duplicate_analysis["Entry_Count"].value_counts().sort_index()
-            )
+            # Entry Distribution Chart - a handful of bars straight from the
+            # numpy counts; no plotly express frame or colorbar payload
+            import plotly.graph_objects as go
 
-            fig_dist = px.bar(
-                x=entry_distribution.index,
-                y=entry_distribution.values,
+            fig_dist = go.Figure(go.Bar(x=entry_counts, y=entry_freqs))
+            fig_dist.update_layout(
                 title="📈 Entry Count Distribution",
-                labels={"x": "Entries per Day", "y": "Number of Employee-Days"},
-                color=entry_distribution.values,
-                color_continuous_scale="Blues",
+                xaxis_title="Entries per Day",
+                yaxis_title="Number of Employee-Days",
+                showlegend=False,
             )
-            fig_dist.update_layout(showlegend=False)
             st.plotly_chart(fig_dist, width="stretch")
 
             # Consolidation Process
@@ -2503,14 +3287,28 @@ def create_dashboard():
                     show_estimation_warnings = st.session_state.get(
                         "show_estimation_warnings", False
                     )
-                    consolidated_data = processor.consolidate_timesheet_data(
-                        raw_data, show_estimation_warnings
+                    include_entry_details = st.session_state.get(
+                        "include_entry_details", False
+                    )
+                    consolidated_data = _consolidate_timesheet(
+                        raw_data,
+                        raw_version,
+                        show_estimation_warnings,
+                        include_entry_details,
                     )
 
                 if not consolidated_data.empty:
                     # Store in session state for later use
                     st.session_state["consolidated_data"] = consolidated_data
                     st.session_state["raw_data"] = raw_data
+                    # Version key for the cached export builders, derived from
+                    # the consolidation inputs so the same file and flags reuse
+                    # the cached results
+                    st.session_state["data_version"] = (
+                        f"timesheet:{raw_version}:"
+                        f"{show_estimation_warnings}:{include_entry_details}"
+                    )
+                    st.session_state.pop("consolidated_excel", None)
 
                     # Success message
                     st.markdown(
@@ -2523,19 +3321,18 @@ def create_dashboard():
                     )
 
                     # Consolidation Summary
+                    n_records = len(consolidated_data)
+                    reduction = total_records - n_records
                     col1, col2, col3, col4 = st.columns(4)
 
                     with col1:
-                        st.metric("📊 Original Records", f"{len(raw_data):,}")
+                        st.metric("📊 Original Records", f"{total_records:,}")
                     with col2:
-                        st.metric(
-                            "🧹 Consolidated Records", f"{len(consolidated_data):,}"
-                        )
+                        st.metric("🧹 Consolidated Records", f"{n_records:,}")
                     with col3:
-                        reduction = len(raw_data) - len(consolidated_data)
                         st.metric("🗑️ Entries Removed", f"{reduction:,}")
                     with col4:
-                        reduction_pct = (reduction / len(raw_data)) * 100
+                        reduction_pct = (reduction / total_records) * 100
                         st.metric("📉 Reduction %", f"{reduction_pct:.1f}%")
 
         # Results Section (if data is consolidated)
@@ -2579,15 +3376,16 @@ def create_dashboard():
                 )
 
             # Create filtered data based on selection
-            filtered_data = consolidated_data.copy()
+            filtered_data = consolidated_data
 
             if filter_option == "Filter by Specific Date":
                 # Parse dates from the data
                 try:
-                    date_list = pd.to_datetime(
-                        consolidated_data["Date"], format="%d-%b-%Y"
-                    ).dt.date.unique()
-                    date_list = sorted(date_list)
+                    # One strptime per distinct date, not per row
+                    date_codes, unique_dates = _factorize_dates(
+                        consolidated_data["Date"], "%d-%b-%Y"
+                    )
+                    date_list = sorted(set(unique_dates.date))
 
                     with col_filter2:
                         selected_date = st.selectbox(
@@ -2599,10 +3397,10 @@ def create_dashboard():
 
                     # Filter data
                     filtered_data = consolidated_data[
-                        pd.to_datetime(
-                            consolidated_data["Date"], format="%d-%b-%Y"
-                        ).dt.date
-                        == selected_date
+                        np.isin(
+                            date_codes,
+                            np.flatnonzero(unique_dates.date == selected_date),
+                        )
                     ]
 
                     with col_filter3:
@@ -2613,10 +3411,10 @@ def create_dashboard():
 
             elif filter_option == "Filter by Date Range":
                 try:
-                    date_list = pd.to_datetime(
-                        consolidated_data["Date"], format="%d-%b-%Y"
-                    ).dt.date.unique()
-                    date_list = sorted(date_list)
+                    date_codes, unique_dates = _factorize_dates(
+                        consolidated_data["Date"], "%d-%b-%Y"
+                    )
+                    date_list = sorted(set(unique_dates.date))
 
                     col_range1, col_range2 = st.columns(2)
 
@@ -2638,11 +3436,11 @@ def create_dashboard():
                         )
 
                     # Filter data
-                    date_column = pd.to_datetime(
-                        consolidated_data["Date"], format="%d-%b-%Y"
-                    ).dt.date
+                    in_range = (unique_dates.date >= start_date) & (
+                        unique_dates.date <= end_date
+                    )
                     filtered_data = consolidated_data[
-                        (date_column >= start_date) & (date_column <= end_date)
+                        np.isin(date_codes, np.flatnonzero(in_range))
                     ]
 
                     with col_filter3:
@@ -2659,16 +3457,22 @@ def create_dashboard():
             st.markdown("---")
 
             # Create a display version of the filtered data
-            display_data = filtered_data.copy()
+            display_data = filtered_data.copy(deep=False)
 
             # Replace data with "Missing Data" for rows with missing/estimated data
             if "_has_missing_data" in display_data.columns:
-                for idx, row in display_data.iterrows():
-                    if row.get("_has_missing_data", False):
-                        # Replace all data columns with "Missing Data"
-                        for col in display_data.columns:
-                            if col not in ["Name", "Date", "_has_missing_data"]:
-                                display_data.at[idx, col] = "Missing Data"
+                missing_rows = display_data["_has_missing_data"].eq(True)
+                if missing_rows.any():
+                    # Replace all data columns with "Missing Data" in one assignment
+                    data_columns = [
+                        col
+                        for col in display_data.columns
+                        if col not in ["Name", "Date", "_has_missing_data"]
+                    ]
+                    display_data[data_columns] = display_data[data_columns].astype(
+                        object
+                    )
+                    display_data.loc[missing_rows, data_columns] = "Missing Data"
 
             # Function to highlight rows with missing data
             def highlight_missing_rows(row):
@@ -2694,26 +3498,49 @@ def create_dashboard():
                 "Total Hours",
                 "Overtime Hours",
                 "Overtime Hours (Decimal)",
+                "Entry Details",
             ]
             display_columns = [
                 col for col in desired_columns if col in available_columns
             ]
 
+            # Only ship one window of rows to the browser; exports use the full
+            # frame. Larger results are paged with a start-row slider
+            max_rows = st.session_state.get("preview_rows", 5000)
+            start_row = 0
+            if len(display_data) > max_rows:
+                start_row = st.slider(
+                    "Start row",
+                    min_value=0,
+                    # Start of the last (possibly shorter) window
+                    max_value=(len(display_data) - 1) // max_rows * max_rows,
+                    value=0,
+                    step=max_rows,
+                    help="Move through the consolidated rows one preview window at a time",
+                    key="preview_start_row",
+                )
+            preview_data = display_data.iloc[start_row : start_row + max_rows]
+
             if display_columns:
                 # Apply styling and display (exclude internal flag column)
-                styled_df = display_data[display_columns].style.apply(
+                styled_df = preview_data[display_columns].style.apply(
                     highlight_missing_rows, axis=1
                 )
-                st.dataframe(styled_df, use_container_width=True, height=500)
+                st.dataframe(styled_df, use_container_width=True, height=420)
             else:
                 # Fallback: show all columns except internal flag
                 cols_to_show = [
                     col for col in available_columns if col != "_has_missing_data"
                 ]
-                styled_df = display_data[cols_to_show].style.apply(
+                styled_df = preview_data[cols_to_show].style.apply(
                     highlight_missing_rows, axis=1
                 )
-                st.dataframe(styled_df, use_container_width=True, height=500)
+                st.dataframe(styled_df, use_container_width=True, height=420)
+
+            if len(display_data) > max_rows:
+                st.caption(
+                    f"Showing rows {start_row + 1:,}-{start_row + len(preview_data):,} of {len(display_data):,} - adjust 'Preview rows' in the sidebar. Exports include all rows."
+                )
 
             # Show legend for color coding
             st.markdown(
@@ -2729,9 +3556,23 @@ def create_dashboard():
                 "✅ **Calculation Summary**: Start Time (First Check-in) | End Time (Last Check-out) | Shift Type (Day/Night) | Total Hours (Work Duration) | Overtime Hours (Based on Business Rules) | Monthly OT Summary (Total overtime hours + number of overtime days for the month)"
             )
 
-            # Analytics Section
+            # Analytics Section - the main charts come from cached builders
+            # keyed on their aggregated data, so reruns skip figure construction
             st.subheader("📈 Analytics & Insights")
 
+            # Cached aggregations and exports are keyed on the data version
+            # (stamped whenever consolidated data is stored) instead of
+            # hashing the whole frame
+            data_version = st.session_state.setdefault("data_version", uuid.uuid4().hex)
+
+            # Overtime-shift mask computed once: metrics count it with .sum(),
+            # only the overtime tab materializes the filtered rows
+            ot_mask = (
+                consolidated_data["Overtime Hours (Decimal)"] > 0
+                if "Overtime Hours (Decimal)" in consolidated_data.columns
+                else None
+            )
+
             # Create tabs for different analytics
             analytics_tab1, analytics_tab2, analytics_tab3, analytics_tab4 = st.tabs(
                 ["🎯 Overview", "👥 By Employee", "📅 By Date", "💼 Overtime"]
@@ -2744,12 +3585,7 @@ def create_dashboard():
                 with col1:
                     if "Shift Time" in consolidated_data.columns:
                         shift_counts = consolidated_data["Shift Time"].value_counts()
-                        fig_pie = px.pie(
-                            values=shift_counts.values,
-                            names=shift_counts.index,
-                            title="🎯 Shift Distribution",
-                            color_discrete_sequence=["#1f77b4", "#ff7f0e"],
-                        )
+                        fig_pie = _shift_distribution_pie(shift_counts)
                         st.plotly_chart(fig_pie, width="stretch")
                     else:
                         st.info(
@@ -2758,10 +3594,7 @@ def create_dashboard():
 
                 with col2:
                     # Overtime Analysis
-                    if "Overtime Hours (Decimal)" in consolidated_data.columns:
-                        overtime_shifts = consolidated_data[
-                            consolidated_data["Overtime Hours (Decimal)"] > 0
-                        ]
+                    if ot_mask is not None:
                         total_overtime_decimal = consolidated_data[
                             "Overtime Hours (Decimal)"
                         ].sum()
@@ -2775,9 +3608,7 @@ def create_dashboard():
                             avg_overtime_per_shift
                         )
 
-                        st.metric(
-                            "💼 Shifts with Overtime", f"{len(overtime_shifts):,}"
-                        )
+                        st.metric("💼 Shifts with Overtime", f"{int(ot_mask.sum()):,}")
                         st.metric("⏰ Total Overtime Hours", total_overtime_formatted)
                         st.metric("📊 Average OT per Shift", avg_overtime_formatted)
                     else:
@@ -2789,44 +3620,18 @@ def create_dashboard():
                     "Name" in consolidated_data.columns
                     and "Total Hours" in consolidated_data.columns
                 ):
-                    agg_dict = {"Total Hours": "sum", "Date": "count"}
-                    col_names = ["Employee", "Total Hours", "Days Worked"]
-
-                    if "Overtime Hours (Decimal)" in consolidated_data.columns:
-                        agg_dict["Overtime Hours (Decimal)"] = "sum"
-                        col_names.insert(2, "Overtime Hours (Decimal)")
-
-                    employee_stats = (
-                        consolidated_data.groupby("Name").agg(agg_dict).reset_index()
-                    )
-                    employee_stats.columns = col_names
-
-                    # Format overtime hours for display if available
-                    if "Overtime Hours (Decimal)" in employee_stats.columns:
-                        employee_stats["Overtime Hours"] = employee_stats[
-                            "Overtime Hours (Decimal)"
-                        ].apply(processor.format_hours_to_time)
-
-                    employee_stats = employee_stats.sort_values(
-                        "Total Hours", ascending=False
-                    )
+                    employee_stats = _employee_stats(consolidated_data, data_version)
 
                     st.dataframe(employee_stats, width="stretch")
 
-                    # Top performers chart
-                    top_10 = employee_stats.head(10)
-                    fig_emp = px.bar(
-                        top_10,
-                        x="Employee",
-                        y="Total Hours",
-                        title="🏆 Top 10 Employees by Total Hours",
-                        color="Total Hours",
-                        color_continuous_scale="Blues",
-                    )
-                    fig_emp.update_xaxes(tickangle=45)
+                    # Top performers chart - partial selection, no full sort needed
+                    top_10 = employee_stats.nlargest(10, "Total Hours")
+                    fig_emp = _top_employees_bar(top_10)
                     st.plotly_chart(fig_emp, width="stretch")
                 else:
-                    st.warning("⚠️ Required columns not available for employee analysis")
+                    st.warning(
+                        "⚠️ Required columns not available for employee analysis"
+                    )
 
             with analytics_tab3:
                 # Date Analysis
@@ -2835,50 +3640,9 @@ def create_dashboard():
                     and "Total Hours" in consolidated_data.columns
                     and "Name" in consolidated_data.columns
                 ):
-                    consolidated_data["Date_parsed"] = pd.to_datetime(
-                        consolidated_data["Date"], format="%d-%b-%Y"
-                    )
-
-                    # Build aggregation dictionary based on available columns
-                    agg_dict = {
-                        "Total Hours": "sum",
-                        "Name": "count",
-                    }
-                    if "Overtime Hours (Decimal)" in consolidated_data.columns:
-                        agg_dict["Overtime Hours (Decimal)"] = "sum"
-
-                    daily_stats = (
-                        consolidated_data.groupby("Date_parsed")
-                        .agg(agg_dict)
-                        .reset_index()
-                    )
-
-                    # Rename columns based on what we have
-                    if "Overtime Hours (Decimal)" in consolidated_data.columns:
-                        daily_stats.columns = [
-                            "Date",
-                            "Total Hours",
-                            "Employees",
-                            "Overtime Hours (Decimal)",
-                        ]
-                        # Format overtime hours for display
-                        daily_stats["Overtime Hours"] = daily_stats[
-                            "Overtime Hours (Decimal)"
-                        ].apply(processor.format_hours_to_time)
-                    else:
-                        daily_stats.columns = [
-                            "Date",
-                            "Total Hours",
-                            "Employees",
-                        ]
+                    daily_stats = _daily_stats(consolidated_data, data_version)
 
-                    fig_daily = px.line(
-                        daily_stats,
-                        x="Date",
-                        y="Total Hours",
-                        title="📅 Daily Total Hours Trend",
-                        markers=True,
-                    )
+                    fig_daily = _daily_hours_line(daily_stats)
                     st.plotly_chart(fig_daily, width="stretch")
                 else:
                     st.info(
@@ -2887,21 +3651,22 @@ def create_dashboard():
 
             with analytics_tab4:
                 # Overtime Analysis
-                if "Overtime Hours (Decimal)" in consolidated_data.columns:
-                    overtime_data = consolidated_data[
-                        consolidated_data["Overtime Hours (Decimal)"] > 0
-                    ]
+                if ot_mask is not None:
+                    overtime_data = consolidated_data.loc[ot_mask]
 
                     if not overtime_data.empty:
                         # Overtime distribution
                         if "Overtime Hours" in overtime_data.columns:
-                            fig_ot = px.histogram(
-                                overtime_data,
-                                x="Overtime Hours",
-                                title="💼 Overtime Hours Distribution",
-                                nbins=20,
-                                color_discrete_sequence=["#ff7f0e"],
+                            # HH:MM:SS labels are categories: count them directly
+                            # (observed labels only, in chronological order)
+                            ot_counts = (
+                                overtime_data["Overtime Hours"]
+                                .astype("category")
+                                .cat.remove_unused_categories()
+                                .value_counts(sort=False)
+                                .sort_index()
                             )
+                            fig_ot = _overtime_distribution_bar(ot_counts)
                             st.plotly_chart(fig_ot, width="stretch")
 
                         # Overtime by shift type
@@ -2920,12 +3685,16 @@ def create_dashboard():
                                 "Average OT (Decimal)",
                             ]
                             # Format the overtime columns for display
-                            ot_by_shift["Total OT"] = ot_by_shift[
-                                "Total OT (Decimal)"
-                            ].apply(processor.format_hours_to_time)
-                            ot_by_shift["Average OT"] = ot_by_shift[
-                                "Average OT (Decimal)"
-                            ].apply(processor.format_hours_to_time)
+                            ot_by_shift["Total OT"] = (
+                                processor.format_hours_to_time_vectorized(
+                                    ot_by_shift["Total OT (Decimal)"]
+                                )
+                            )
+                            ot_by_shift["Average OT"] = (
+                                processor.format_hours_to_time_vectorized(
+                                    ot_by_shift["Average OT (Decimal)"]
+                                )
+                            )
                             # Display with formatted columns
                             display_ot_by_shift = ot_by_shift[
                                 ["Shift Type", "Count", "Total OT", "Average OT"]
@@ -2945,11 +3714,17 @@ def create_dashboard():
             # Export Section
             st.subheader("💾 Export Data")
 
-            col1, col2 = st.columns(2)
+            # Parquet is offered alongside CSV/Excel when pyarrow is installed
+            if PYARROW_AVAILABLE:
+                col1, col2, col3 = st.columns(3)
+            else:
+                col1, col2 = st.columns(2)
 
             with col1:
                 # CSV Export
-                csv_data = consolidated_data[display_columns].to_csv(index=False)
+                csv_data = _build_results_export(
+                    consolidated_data, data_version, tuple(display_columns), "csv"
+                )
                 st.download_button(
                     label="📄 Download CSV",
                     data=csv_data,
@@ -2959,153 +3734,48 @@ def create_dashboard():
                 )
 
             with col2:
-                # Excel Export with Overal and Consolidated sheets
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine="openpyxl") as writer:
-                    # Sheet 1: Overal - Detailed records (all consolidated data with all columns)
-                    consolidated_data[display_columns].to_excel(
-                        writer, sheet_name="Overal", index=False
-                    )
-
-                    # Add AutoFilter to Overal sheet for easy filtering
-                    overal_sheet = writer.sheets["Overal"]
-                    overal_sheet.auto_filter.ref = overal_sheet.dimensions
-                    # Freeze the header row
-                    overal_sheet.freeze_panes = "A2"
-
-                    # Sheet 2: Consolidated - Summary by employee (ONE row per employee)
-                    if (
-                        "Name" in consolidated_data.columns
-                        and "Date" in consolidated_data.columns
-                    ):
-                        # Create consolidated summary - group by employee only (not by month)
-                        temp_df = consolidated_data.copy()
-
-                        # Build aggregation based on available columns
-                        agg_dict = {
-                            "Date": "count",  # Count of working days
-                        }
-
-                        if "Total Hours" in temp_df.columns:
-                            agg_dict["Total Hours"] = "sum"
-
-                        if "Overtime Hours (Decimal)" in temp_df.columns:
-                            agg_dict["Overtime Hours (Decimal)"] = "sum"
-
-                        # Group by Name only (not by month) - ONE row per employee
-                        consolidated_summary = (
-                            temp_df.groupby("Name").agg(agg_dict).reset_index()
-                        )
-
-                        # Rename columns
-                        col_mapping = {
-                            "Name": "EMPLOYEE NAME",
-                            "Date": "Days Worked",
-                        }
-                        if "Total Hours" in agg_dict:
-                            col_mapping["Total Hours"] = "Total Hours Worked"
-                        if "Overtime Hours (Decimal)" in agg_dict:
-                            col_mapping["Overtime Hours (Decimal)"] = (
-                                "Total Overtime Hours"
-                            )
-
-                        consolidated_summary = consolidated_summary.rename(
-                            columns=col_mapping
-                        )
-
-                        # Round hours to 2 decimal places
-                        if "Total Hours Worked" in consolidated_summary.columns:
-                            consolidated_summary["Total Hours Worked"] = (
-                                consolidated_summary["Total Hours Worked"].round(2)
-                            )
-                        if "Total Overtime Hours" in consolidated_summary.columns:
-                            consolidated_summary["Total Overtime Hours"] = (
-                                consolidated_summary["Total Overtime Hours"].round(2)
-                            )
-
-                        # Add SN column
-                        consolidated_summary.insert(
-                            0, "SN", range(1, len(consolidated_summary) + 1)
-                        )
-
-                        # Sort by employee name
-                        consolidated_summary = consolidated_summary.sort_values(
-                            "EMPLOYEE NAME"
-                        ).reset_index(drop=True)
-                        # Update SN after sorting
-                        consolidated_summary["SN"] = range(
-                            1, len(consolidated_summary) + 1
-                        )
-
-                        consolidated_summary.to_excel(
-                            writer, sheet_name="Consolidated", index=False
+                # Excel Export with Overal and Consolidated sheets - the
+                # workbook is only built on request and kept in session state
+                # (cleared when new data is consolidated), so other reruns
+                # never touch the Excel writer
+                excel_key = tuple(display_columns)
+                if st.button("🛠️ Prepare Excel (Overal + Consolidated)"):
+                    with st.spinner("Building Excel workbook..."):
+                        st.session_state["consolidated_excel"] = (
+                            excel_key,
+                            _build_consolidated_excel(
+                                consolidated_data, data_version, display_columns
+                            ),
                         )
+                prepared = st.session_state.get("consolidated_excel")
+                if prepared is not None and prepared[0] == excel_key:
+                    st.download_button(
+                        label="📊 Download Excel (Overal + Consolidated)",
+                        data=prepared[1],
+                        file_name=f"OT_Management_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        type="secondary",
+                    )
 
-                        # Add AutoFilter to Consolidated sheet for easy filtering
-                        consolidated_sheet = writer.sheets["Consolidated"]
-                        consolidated_sheet.auto_filter.ref = (
-                            consolidated_sheet.dimensions
+            if PYARROW_AVAILABLE:
+                with col3:
+                    # Parquet Export - columnar, fast to write and re-import
+                    try:
+                        parquet_data = _build_results_export(
+                            consolidated_data,
+                            data_version,
+                            tuple(display_columns),
+                            "parquet",
                         )
-                        # Freeze the header row
-                        consolidated_sheet.freeze_panes = "A2"
-                    else:
-                        # If we can't create monthly summary, just duplicate Overal sheet
-                        consolidated_data[display_columns].to_excel(
-                            writer, sheet_name="Consolidated", index=False
+                        st.download_button(
+                            label="📦 Download Parquet",
+                            data=parquet_data,
+                            file_name=f"consolidated_timesheet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                            mime="application/octet-stream",
+                            type="secondary",
                         )
-
-                    # Add Type of Work dropdown to Overal sheet if column exists
-                    if "Type of Work" in display_columns:
-                        from openpyxl.utils import get_column_letter
-                        from openpyxl.worksheet.datavalidation import DataValidation
-
-                        overal_sheet = writer.sheets["Overal"]
-
-                        # Find Type of Work column
-                        type_col_idx = None
-                        for idx, col in enumerate(display_columns, start=1):
-                            if col == "Type of Work":
-                                type_col_idx = idx
-                                break
-
-                        if type_col_idx:
-                            col_letter = get_column_letter(type_col_idx)
-                            work_types = [
-                                "Wagon",
-                                "Superloader",
-                                "Bulldozer/Superloader",
-                                "Pump",
-                                "Miller",
-                            ]
-                            formula_string = '"{}"'.format(",".join(work_types))
-
-                            dv = DataValidation(
-                                type="list",
-                                formula1=formula_string,
-                                allow_blank=True,
-                                showDropDown=False,
-                            )
-                            dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
-                            dv.errorTitle = "Invalid Entry"
-                            dv.prompt = "Choose work type"
-                            dv.promptTitle = "Type of Work Selection"
-
-                            start_row = 2
-                            end_row = len(consolidated_data) + 1
-                            range_string = (
-                                f"{col_letter}{start_row}:{col_letter}{end_row}"
-                            )
-                            dv.add(range_string)
-                            overal_sheet.add_data_validation(dv)
-
-                excel_data = output.getvalue()
-                st.download_button(
-                    label="📊 Download Excel (Overal + Consolidated)",
-                    data=excel_data,
-                    file_name=f"OT_Management_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    type="secondary",
-                )
+                    except Exception as e:
+                        st.warning(f"⚠️ Parquet export unavailable: {str(e)}")
 
     # Sidebar
     with st.sidebar:
@@ -3119,6 +3789,21 @@ def create_dashboard():
             help="Show warnings when check-in/check-out times are estimated for incomplete records",
             key="sidebar_estimation_warnings",
         )
+        st.session_state["include_entry_details"] = st.checkbox(
+            "Include entry audit column (slower)",
+            value=st.session_state.get("include_entry_details", False),
+            help="Add an 'Entry Details' column listing the check-in/check-out entries used for each consolidated row",
+            key="sidebar_entry_details",
+        )
+        st.slider(
+            "Preview rows",
+            min_value=1000,
+            max_value=50000,
+            value=5000,
+            step=1000,
+            help="Maximum number of consolidated rows rendered in the results table. Exports always include all rows.",
+            key="preview_rows",
+        )
 
         # Quick Load Section
         st.subheader("⚡ Quick Load")
@@ -3231,6 +3916,11 @@ def create_dashboard():
                             # Store in session state for Filter & Export tab
                             st.session_state["overal_data"] = overal_df
                             st.session_state["consolidated_data"] = consolidated_df
+                            st.session_state["data_version"] = (
+                                "attendance:"
+                                + hashlib.sha1(uploaded_att.getvalue()).hexdigest()
+                            )
+                            st.session_state.pop("consolidated_excel", None)
                             rtab1, rtab2 = st.tabs(
                                 ["📝 Overal Sheet", "📊 Consolidated Sheet"]
                             )
@@ -3243,11 +3933,9 @@ def create_dashboard():
                                 col1, col2, col3 = st.columns(3)
                                 col1.metric("Total Records", len(overal_df))
                                 # Convert HH:MM:SS to decimal for sum
-                                total_hours_decimal = (
+                                total_hours_decimal = hms_series_to_decimal_hours(
                                     overal_df["No. Hours"]
-                                    .apply(hms_to_decimal_hours)
-                                    .sum()
-                                )
+                                ).sum()
                                 col2.metric(
                                     "Total Hours", f"{total_hours_decimal:.2f}h"
                                 )
@@ -3265,70 +3953,9 @@ def create_dashboard():
                                 )
 
                             # Download button
-                            buffer = io.BytesIO()
-                            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                                overal_df.to_excel(
-                                    writer, sheet_name="Overal", index=False
-                                )
-                                consolidated_df.to_excel(
-                                    writer, sheet_name="Consolidated", index=False
-                                )
-
-                                # Add dropdown to "Type of Work" column in Overal sheet
-                                from openpyxl.worksheet.datavalidation import (
-                                    DataValidation,
-                                )
-
-                                workbook = writer.book
-                                overal_sheet = writer.sheets["Overal"]
-
-                                # Find "Type of Work" column index
-                                type_of_work_col = None
-                                for idx, col in enumerate(overal_df.columns, start=1):
-                                    if col == "Type of Work":
-                                        type_of_work_col = idx
-                                        break
-
-                                if type_of_work_col:
-                                    # Create dropdown with the 5 work types
-                                    from openpyxl.utils import get_column_letter
-
-                                    col_letter = get_column_letter(type_of_work_col)
-
-                                    # Define dropdown options - use proper Excel list format
-                                    work_types = [
-                                        "Wagon",
-                                        "Superloader",
-                                        "Bulldozer/Superloader",
-                                        "Pump",
-                                        "Miller",
-                                    ]
-                                    formula_string = '"{}"'.format(",".join(work_types))
-
-                                    dv = DataValidation(
-                                        type="list",
-                                        formula1=formula_string,
-                                        allow_blank=True,
-                                        showDropDown=False,  # Show dropdown arrow
-                                    )
-                                    dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
-                                    dv.errorTitle = "Invalid Entry"
-                                    dv.prompt = "Choose work type: Wagon, Superloader, Bulldozer/Superloader, Pump, Miller"
-                                    dv.promptTitle = "Type of Work Selection"
-
-                                    # Apply to all data rows (excluding header)
-                                    start_row = 2
-                                    end_row = len(overal_df) + 1
-                                    range_string = (
-                                        f"{col_letter}{start_row}:{col_letter}{end_row}"
-                                    )
-                                    dv.add(range_string)
-
-                                    overal_sheet.add_data_validation(dv)
-
                             st.download_button(
                                 "📥 Download OT Management Excel (Both Sheets)",
-                                buffer.getvalue(),
+                                _ot_management_excel_bytes(overal_df, consolidated_df),
                                 f"OT_Management_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
                                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                             )
@@ -3434,6 +4061,9 @@ def create_dashboard():
                             st.markdown("---")
                             st.subheader("🏆 Top 10 Rankings")
 
+                            import plotly.express as px
+                            import plotly.graph_objects as go
+
                             tab_ot, tab_weekend, tab_attendance = st.tabs(
                                 [
                                     "⏰ Overtime Hours",
@@ -3447,7 +4077,6 @@ def create_dashboard():
 
                                 with col_left:
                                     # Create overtime chart
-                                    import plotly.express as px
                                     fig_ot = px.bar(
                                         top_10["top_overtime"],
                                         x="Name",
@@ -3462,7 +4091,7 @@ def create_dashboard():
 
                                 with col_right:
                                     st.markdown("### 📋 Rankings")
-                                    df_display = top_10["top_overtime"].copy()
+                                    df_display = top_10["top_overtime"].copy(deep=False)
                                     df_display["Rank"] = range(1, len(df_display) + 1)
                                     df_display = df_display[
                                         [
@@ -3501,7 +4130,7 @@ def create_dashboard():
 
                                 with col_right:
                                     st.markdown("### 📋 Rankings")
-                                    df_display = top_10["top_weekend"].copy()
+                                    df_display = top_10["top_weekend"].copy(deep=False)
                                     df_display["Rank"] = range(1, len(df_display) + 1)
                                     df_display = df_display[
                                         [
@@ -3538,7 +4167,9 @@ def create_dashboard():
 
                                 with col_right:
                                     st.markdown("### 📋 Rankings")
-                                    df_display = top_10["top_attendance"].copy()
+                                    df_display = top_10["top_attendance"].copy(
+                                        deep=False
+                                    )
                                     df_display["Rank"] = range(1, len(df_display) + 1)
                                     df_display = df_display[
                                         [
@@ -3761,28 +4392,14 @@ def create_dashboard():
 
                             with col1:
                                 # Export to Excel
-                                output = io.BytesIO()
-                                with pd.ExcelWriter(
-                                    output, engine="openpyxl"
-                                ) as writer:
-                                    combined.to_excel(
-                                        writer, sheet_name="All Employees", index=False
-                                    )
-                                    top_10["top_overtime"].to_excel(
-                                        writer,
-                                        sheet_name="Top 10 Overtime",
-                                        index=False,
-                                    )
-                                    top_10["top_weekend"].to_excel(
-                                        writer, sheet_name="Top 10 Weekend", index=False
-                                    )
-                                    top_10["top_attendance"].to_excel(
-                                        writer,
-                                        sheet_name="Top 10 Attendance",
-                                        index=False,
-                                    )
-
-                                output.seek(0)
+                                output = _build_excel_bytes(
+                                    {
+                                        "All Employees": combined,
+                                        "Top 10 Overtime": top_10["top_overtime"],
+                                        "Top 10 Weekend": top_10["top_weekend"],
+                                        "Top 10 Attendance": top_10["top_attendance"],
+                                    }
+                                )
 
                                 st.download_button(
                                     label="📥 Download Excel Report",
@@ -3794,7 +4411,7 @@ def create_dashboard():
 
                             with col2:
                                 # Export to CSV
-                                csv = combined.to_csv(index=False)
+                                csv = _build_csv_bytes(combined)
 
                                 st.download_button(
                                     label="📥 Download CSV Report",
@@ -3905,18 +4522,22 @@ def create_dashboard():
                     
                     method_summary = verify_stats['by_method']
                     
-                    for idx, row in method_summary.iterrows():
-                        icon = {'Fingerprint': '🖐️', 'Password': '🔑', 'RFID': '📡'}.get(row['Method'], '❓')
-                        col = [col1, col2, col3][idx]
+                    # itertuples yields plain namedtuples; the index label keeps each
+                    # method in its own column regardless of the sort order
+                    for row in method_summary.itertuples():
+                        icon = {'Fingerprint': '🖐️', 'Password': '🔑', 'RFID': '📡'}.get(row.Method, '❓')
+                        col = [col1, col2, col3][row.Index]
                         
                         with col:
                             st.metric(
-                                label=f"{icon} {row['Method']}",
-                                value=f"{row['Total_Count']:,} uses",
-                                delta=f"{row['Employee_Count']} employees ({row['Percentage']:.1f}%)"
+                                label=f"{icon} {row.Method}",
+                                value=f"{row.Total_Count:,} uses",
+                                delta=f"{row.Employee_Count} employees ({row.Percentage:.1f}%)"
                             )
                     
                     # Visualization: Method Distribution
+                    import plotly.express as px
+
                     st.markdown("---")
                     st.subheader("📈 Method Usage Distribution")
                     
@@ -3941,9 +4562,9 @@ def create_dashboard():
                     st.markdown("**All verification methods shown in one table with usage counts**")
                     
                     # Get top 10 for each method
-                    top_fp_list = verify_stats['method_users']['FP'].head(10).copy() if not verify_stats['method_users']['FP'].empty else pd.DataFrame()
-                    top_pw_list = verify_stats['method_users']['PW'].head(10).copy() if not verify_stats['method_users']['PW'].empty else pd.DataFrame()
-                    top_rf_list = verify_stats['method_users']['RF'].head(10).copy() if not verify_stats['method_users']['RF'].empty else pd.DataFrame()
+                    top_fp_list = verify_stats['method_users']['FP'].head(10) if not verify_stats['method_users']['FP'].empty else pd.DataFrame()
+                    top_pw_list = verify_stats['method_users']['PW'].head(10) if not verify_stats['method_users']['PW'].empty else pd.DataFrame()
+                    top_rf_list = verify_stats['method_users']['RF'].head(10) if not verify_stats['method_users']['RF'].empty else pd.DataFrame()
                     
                     # Create side-by-side display
                     col1, col2, col3 = st.columns(3)
@@ -3951,7 +4572,7 @@ def create_dashboard():
                     with col1:
                         st.markdown("### 🖐️ Fingerprint (FP)")
                         if not top_fp_list.empty:
-                            fp_display = top_fp_list[['Name', 'Department', 'Usage_Count']].copy()
+                            fp_display = top_fp_list[['Name', 'Department', 'Usage_Count']]
                             fp_display.insert(0, 'Rank', range(1, len(fp_display) + 1))
                             st.dataframe(fp_display, use_container_width=True, hide_index=True, height=400)
                             st.metric("Total FP Users", len(verify_stats['method_users']['FP']))
@@ -3961,7 +4582,7 @@ def create_dashboard():
                     with col2:
                         st.markdown("### 🔑 Password (PW)")
                         if not top_pw_list.empty:
-                            pw_display = top_pw_list[['Name', 'Department', 'Usage_Count']].copy()
+                            pw_display = top_pw_list[['Name', 'Department', 'Usage_Count']]
                             pw_display.insert(0, 'Rank', range(1, len(pw_display) + 1))
                             st.dataframe(pw_display, use_container_width=True, hide_index=True, height=400)
                             st.metric("Total PW Users", len(verify_stats['method_users']['PW']))
@@ -3971,7 +4592,7 @@ def create_dashboard():
                     with col3:
                         st.markdown("### 📡 RFID (RF)")
                         if not top_rf_list.empty:
-                            rf_display = top_rf_list[['Name', 'Department', 'Usage_Count']].copy()
+                            rf_display = top_rf_list[['Name', 'Department', 'Usage_Count']]
                             rf_display.insert(0, 'Rank', range(1, len(rf_display) + 1))
                             st.dataframe(rf_display, use_container_width=True, hide_index=True, height=400)
                             st.metric("Total RF Users", len(verify_stats['method_users']['RF']))
@@ -3983,7 +4604,7 @@ def create_dashboard():
                     st.subheader("📊 Combined Summary - All Methods in One Sheet")
                     
                     # Show complete employee list with ALL verification counts
-                    combined_summary = verify_stats['by_employee'].copy()
+                    combined_summary = verify_stats['by_employee'].copy(deep=False)
                     combined_summary.insert(0, 'Rank', range(1, len(combined_summary) + 1))
                     
                     # Reorder columns for better display
@@ -4002,7 +4623,7 @@ def create_dashboard():
                     )
                     
                     # Download button for combined summary
-                    csv_combined = combined_summary_display.to_csv(index=False)
+                    csv_combined = _build_csv_bytes(combined_summary_display)
                     st.download_button(
                         label="📥 Download Combined Summary (CSV)",
                         data=csv_combined,
@@ -4019,17 +4640,17 @@ def create_dashboard():
                     comparison_data = []
                     
                     if not verify_stats['method_users']['FP'].empty:
-                        top_fp_chart = verify_stats['method_users']['FP'].head(10).copy()
+                        top_fp_chart = verify_stats['method_users']['FP'].head(10)
                         top_fp_chart['Method'] = 'Fingerprint'
                         comparison_data.append(top_fp_chart[['Name', 'Usage_Count', 'Method']])
                     
                     if not verify_stats['method_users']['PW'].empty:
-                        top_pw_chart = verify_stats['method_users']['PW'].head(10).copy()
+                        top_pw_chart = verify_stats['method_users']['PW'].head(10)
                         top_pw_chart['Method'] = 'Password'
                         comparison_data.append(top_pw_chart[['Name', 'Usage_Count', 'Method']])
                     
                     if not verify_stats['method_users']['RF'].empty:
-                        top_rf_chart = verify_stats['method_users']['RF'].head(10).copy()
+                        top_rf_chart = verify_stats['method_users']['RF'].head(10)
                         top_rf_chart['Method'] = 'RFID'
                         comparison_data.append(top_rf_chart[['Name', 'Usage_Count', 'Method']])
                     
@@ -4073,7 +4694,7 @@ def create_dashboard():
                     with tab_fp:
                         st.markdown(f"**{len(verify_stats['method_users']['FP'])} employees** use Fingerprint verification")
                         if not verify_stats['method_users']['FP'].empty:
-                            fp_display = verify_stats['method_users']['FP'].copy()
+                            fp_display = verify_stats['method_users']['FP'].copy(deep=False)
                             fp_display['Rank'] = range(1, len(fp_display) + 1)
                             fp_display = fp_display[['Rank', 'Name', 'Department', 'Usage_Count', 'Total_Records']]
                             fp_display['Usage_%'] = (fp_display['Usage_Count'] / fp_display['Total_Records'] * 100).round(2)
@@ -4098,7 +4719,7 @@ def create_dashboard():
                     with tab_pw:
                         st.markdown(f"**{len(verify_stats['method_users']['PW'])} employees** use Password verification")
                         if not verify_stats['method_users']['PW'].empty:
-                            pw_display = verify_stats['method_users']['PW'].copy()
+                            pw_display = verify_stats['method_users']['PW'].copy(deep=False)
                             pw_display['Rank'] = range(1, len(pw_display) + 1)
                             pw_display = pw_display[['Rank', 'Name', 'Department', 'Usage_Count', 'Total_Records']]
                             pw_display['Usage_%'] = (pw_display['Usage_Count'] / pw_display['Total_Records'] * 100).round(2)
@@ -4123,7 +4744,7 @@ def create_dashboard():
                     with tab_rf:
                         st.markdown(f"**{len(verify_stats['method_users']['RF'])} employees** use RFID verification")
                         if not verify_stats['method_users']['RF'].empty:
-                            rf_display = verify_stats['method_users']['RF'].copy()
+                            rf_display = verify_stats['method_users']['RF'].copy(deep=False)
                             rf_display['Rank'] = range(1, len(rf_display) + 1)
                             rf_display = rf_display[['Rank', 'Name', 'Department', 'Usage_Count', 'Total_Records']]
                             rf_display['Usage_%'] = (rf_display['Usage_Count'] / rf_display['Total_Records'] * 100).round(2)
@@ -4147,7 +4768,7 @@ def create_dashboard():
                     with tab_all:
                         st.markdown(f"**Complete list of all {len(verify_stats['by_employee'])} employees** with verification method breakdown")
                         
-                        all_display = verify_stats['by_employee'].copy()
+                        all_display = verify_stats['by_employee'].copy(deep=False)
                         all_display['Rank'] = range(1, len(all_display) + 1)
                         all_display = all_display[[
                             'Rank', 'Name', 'Department', 
@@ -4158,7 +4779,7 @@ def create_dashboard():
                         st.dataframe(all_display, use_container_width=True, hide_index=True)
                         
                         # Download button
-                        csv = all_display.to_csv(index=False)
+                        csv = _build_csv_bytes(all_display)
                         st.download_button(
                             label="📥 Download Full Report (CSV)",
                             data=csv,
@@ -4207,7 +4828,9 @@ def create_dashboard():
             "overal_data" in st.session_state
             and st.session_state["overal_data"] is not None
         ):
-            df_analysis = st.session_state["overal_data"].copy()
+            import plotly.express as px
+
+            df_analysis = st.session_state["overal_data"].copy(deep=False)
 
             # Rename columns for consistency with analysis
             df_analysis.rename(
@@ -4220,31 +4843,47 @@ def create_dashboard():
                 inplace=True,
             )
 
+            # Arrow-backed strings for the employee key every breakdown below
+            # groups on (already the default string storage on pandas 3)
+            if PYARROW_AVAILABLE and "Name" in df_analysis.columns:
+                df_analysis["Name"] = df_analysis["Name"].astype("string[pyarrow]")
+
             # Add Total Hours column by converting HH:MM:SS to decimal
             if "No. Hours" in df_analysis.columns:
-                df_analysis["Total Hours"] = df_analysis["No. Hours"].apply(
-                    hms_to_decimal_hours
+                df_analysis["Total Hours"] = hms_series_to_decimal_hours(
+                    df_analysis["No. Hours"]
                 )
 
             # Add Shift Time column based on Start Time
-            def determine_shift_from_time(start_time_str):
-                """Determine shift type from start time string"""
-                if pd.isna(start_time_str) or start_time_str == "N/A":
-                    return "Unknown"
-                try:
-                    start_time = pd.to_datetime(start_time_str, format="%H:%M").time()
-                    start_hour = start_time.hour + start_time.minute / 60
-                    return "Day Shift" if start_hour < 18.0 else "Night Shift"
-                except:
-                    return "Unknown"
-
+            # Whole-column parse ("HH:MM"; "N/A"/blank/unparseable -> NaT), then
+            # one np.select: Unknown / Day Shift (before 18:00) / Night Shift,
+            # kept as a categorical since it has only these three values
             if "Start Time" in df_analysis.columns:
-                df_analysis["Shift Time"] = df_analysis["Start Time"].apply(
-                    determine_shift_from_time
+                start_parsed = pd.to_datetime(
+                    df_analysis["Start Time"], format="%H:%M", errors="coerce"
+                )
+                df_analysis["Shift Time"] = pd.Categorical(
+                    np.select(
+                        [start_parsed.isna(), start_parsed.dt.hour < 18],
+                        ["Unknown", "Day Shift"],
+                        default="Night Shift",
+                    ),
+                    categories=["Day Shift", "Night Shift", "Unknown"],
                 )
             else:
                 df_analysis["Shift Time"] = "Unknown"
 
+            # Work date parsed once (cache=True memoizes the repeated date
+            # strings); the weekday and weekly breakdowns below reuse it
+            df_analysis["Date_dt"] = pd.to_datetime(
+                df_analysis["Date"], format="%d-%b-%Y", cache=True
+            )
+            df_analysis["Day_of_Week"] = df_analysis["Date_dt"].dt.day_name()
+
+            # Overtime-day mask computed once; counts use .sum() on it instead
+            # of filtering a copy of the frame
+            has_ot = df_analysis["Overtime Hours (Decimal)"] > 0
+
             st.subheader("🎯 Key Performance Indicators")
             col1, col2, col3, col4 = st.columns(4)
 
@@ -4263,9 +4902,7 @@ def create_dashboard():
                 st.metric("📊 Avg OT/Employee", f"{avg_ot_per_employee:.1f}h")
 
             with col4:
-                ot_shifts = len(
-                    df_analysis[df_analysis["Overtime Hours (Decimal)"] > 0]
-                )
+                ot_shifts = int(has_ot.sum())
                 ot_rate = (
                     (ot_shifts / len(df_analysis) * 100) if len(df_analysis) > 0 else 0
                 )
@@ -4299,7 +4936,9 @@ def create_dashboard():
 
                 with col_wh4:
                     # Most productive day
-                    daily_hours = df_analysis.groupby("Date")["Total Hours"].sum()
+                    daily_hours = df_analysis.groupby(
+                        "Date", observed=True, sort=False
+                    )["Total Hours"].sum()
                     if not daily_hours.empty:
                         max_hours_date = daily_hours.idxmax()
                         max_hours = daily_hours.max()
@@ -4334,14 +4973,10 @@ def create_dashboard():
 
                 with col_chart2:
                     st.markdown("### 🕐 Average Working Hours by Weekday")
-                    df_analysis["Date_dt"] = pd.to_datetime(
-                        df_analysis["Date"], format="%d-%b-%Y"
-                    )
-                    df_analysis["Day_of_Week"] = df_analysis["Date_dt"].dt.day_name()
 
-                    hours_by_day = df_analysis.groupby("Day_of_Week")[
-                        "Total Hours"
-                    ].mean()
+                    hours_by_day = df_analysis.groupby(
+                        "Day_of_Week", observed=True, sort=False
+                    )["Total Hours"].mean()
                     day_order = [
                         "Monday",
                         "Tuesday",
@@ -4371,30 +5006,23 @@ def create_dashboard():
 
                 with col_emp1:
                     st.markdown("#### 🏆 Most Working Hours (Total)")
+                    # Sum and day count per employee in one groupby pass
                     top_workers = (
-                        df_analysis.groupby("Name")["Total Hours"]
-                        .sum()
-                        .sort_values(ascending=False)
-                        .head(10)
+                        df_analysis.groupby("Name", observed=True, sort=False)[
+                            "Total Hours"
+                        ]
+                        .agg(["sum", "size"])
+                        .nlargest(10, "sum")
                     )
                     if not top_workers.empty:
                         top_workers_df = pd.DataFrame(
                             {
                                 "Employee": top_workers.index,
-                                "Total Hours": top_workers.values.round(1),
-                                "Work Days": [
-                                    len(df_analysis[df_analysis["Name"] == name])
-                                    for name in top_workers.index
-                                ],
-                                "Avg Hours/Day": [
-                                    (
-                                        df_analysis[df_analysis["Name"] == name][
-                                            "Total Hours"
-                                        ].sum()
-                                        / len(df_analysis[df_analysis["Name"] == name])
-                                    )
-                                    for name in top_workers.index
-                                ],
+                                "Total Hours": top_workers["sum"].values.round(1),
+                                "Work Days": top_workers["size"].values,
+                                "Avg Hours/Day": (
+                                    top_workers["sum"] / top_workers["size"]
+                                ).values,
                             }
                         )
                         top_workers_df["Avg Hours/Day"] = top_workers_df[
@@ -4437,12 +5065,14 @@ def create_dashboard():
 
                 # Parse start and end times
                 try:
-                    df_analysis["Start_Time_Parsed"] = pd.to_datetime(
+                    start_parsed = pd.to_datetime(
                         df_analysis["Start Time"], format="%H:%M:%S", errors="coerce"
-                    ).dt.time
-                    df_analysis["End_Time_Parsed"] = pd.to_datetime(
+                    )
+                    end_parsed = pd.to_datetime(
                         df_analysis["End Time"], format="%H:%M:%S", errors="coerce"
-                    ).dt.time
+                    )
+                    df_analysis["Start_Time_Parsed"] = start_parsed.dt.time
+                    df_analysis["End_Time_Parsed"] = end_parsed.dt.time
 
                     # Find most common start and end times
                     common_start = df_analysis["Start_Time_Parsed"].mode()
@@ -4473,11 +5103,7 @@ def create_dashboard():
 
                     with col_pattern1:
                         st.markdown("#### 🌅 Early Starters (Before 8 AM)")
-                        early_birds = df_analysis[
-                            df_analysis["Start_Time_Parsed"].apply(
-                                lambda x: x.hour < 8 if pd.notna(x) else False
-                            )
-                        ]
+                        early_birds = df_analysis[start_parsed.dt.hour.lt(8)]
                         if not early_birds.empty:
                             early_count = early_birds["Name"].value_counts().head(5)
                             st.dataframe(
@@ -4494,11 +5120,7 @@ def create_dashboard():
 
                     with col_pattern2:
                         st.markdown("#### 🌙 Late Finishers (After 8 PM)")
-                        late_workers = df_analysis[
-                            df_analysis["End_Time_Parsed"].apply(
-                                lambda x: x.hour >= 20 if pd.notna(x) else False
-                            )
-                        ]
+                        late_workers = df_analysis[end_parsed.dt.hour.ge(20)]
                         if not late_workers.empty:
                             late_count = late_workers["Name"].value_counts().head(5)
                             st.dataframe(
@@ -4531,25 +5153,21 @@ def create_dashboard():
             with col_left:
                 st.markdown("### 🏆 Top Performers (Highest OT)")
                 top_ot = (
-                    df_analysis.groupby("Name")["Overtime Hours (Decimal)"]
+                    df_analysis.groupby("Name", observed=True, sort=False)[
+                        "Overtime Hours (Decimal)"
+                    ]
                     .sum()
-                    .sort_values(ascending=False)
-                    .head(10)
+                    .nlargest(10)
                 )
                 if not top_ot.empty:
+                    ot_days = df_analysis.loc[has_ot, "Name"].value_counts()
                     top_ot_df = pd.DataFrame(
                         {
                             "Employee": top_ot.index,
                             "Total OT Hours": top_ot.values.round(2),
-                            "OT Days": [
-                                len(
-                                    df_analysis[
-                                        (df_analysis["Name"] == name)
-                                        & (df_analysis["Overtime Hours (Decimal)"] > 0)
-                                    ]
-                                )
-                                for name in top_ot.index
-                            ],
+                            "OT Days": ot_days.reindex(
+                                top_ot.index, fill_value=0
+                            ).to_numpy(),
                         }
                     )
                     st.dataframe(top_ot_df, hide_index=True, use_container_width=True)
@@ -4562,13 +5180,9 @@ def create_dashboard():
 
             with col_right:
                 st.markdown("### 📅 OT Distribution by Day")
-                df_analysis["Date_dt"] = pd.to_datetime(
-                    df_analysis["Date"], format="%d-%b-%Y"
-                )
-                df_analysis["Day_of_Week"] = df_analysis["Date_dt"].dt.day_name()
-                ot_by_day = df_analysis.groupby("Day_of_Week")[
-                    "Overtime Hours (Decimal)"
-                ].sum()
+                ot_by_day = df_analysis.groupby(
+                    "Day_of_Week", observed=True, sort=False
+                )["Overtime Hours (Decimal)"].sum()
 
                 day_order = [
                     "Monday",
@@ -4607,10 +5221,9 @@ def create_dashboard():
                 ]
                 if not incomplete.empty:
                     incomplete_summary = (
-                        incomplete.groupby("Name")
+                        incomplete.groupby("Name", observed=True, sort=False)
                         .size()
-                        .sort_values(ascending=False)
-                        .head(10)
+                        .nlargest(10)
                     )
                     st.dataframe(
                         pd.DataFrame(
@@ -4629,7 +5242,7 @@ def create_dashboard():
 
             with col2:
                 st.markdown("### 🌙 Day vs Night Shift Analysis")
-                shift_ot = df_analysis.groupby("Shift Time")[
+                shift_ot = df_analysis.groupby("Shift Time", observed=True)[
                     "Overtime Hours (Decimal)"
                 ].agg(["sum", "mean", "count"])
                 shift_ot.columns = ["Total OT", "Avg OT/Shift", "Total Shifts"]
@@ -4691,7 +5304,7 @@ def create_dashboard():
             recommendations = []
 
             # High OT employees
-            high_ot_employees = df_analysis.groupby("Name")[
+            high_ot_employees = df_analysis.groupby("Name", observed=True, sort=False)[
                 "Overtime Hours (Decimal)"
             ].sum()
             critical_ot = high_ot_employees[high_ot_employees > 25]
@@ -4717,9 +5330,9 @@ def create_dashboard():
                     )
 
             # Consistent high performers
-            consistent_ot = df_analysis.groupby("Name")["Overtime Hours (Decimal)"].agg(
-                lambda x: (x > 0).sum()
-            )
+            consistent_ot = has_ot.groupby(
+                df_analysis["Name"], observed=True, sort=False
+            ).sum()
             very_consistent = consistent_ot[
                 consistent_ot > len(df_analysis["Date"].unique()) * 0.7
             ]
@@ -4731,9 +5344,9 @@ def create_dashboard():
             # Working Hours Analysis Recommendations
             if "Total Hours" in df_analysis.columns:
                 # Long working hours
-                avg_hours_per_employee = df_analysis.groupby("Name")[
-                    "Total Hours"
-                ].mean()
+                avg_hours_per_employee = df_analysis.groupby(
+                    "Name", observed=True, sort=False
+                )["Total Hours"].mean()
                 long_hours_employees = avg_hours_per_employee[
                     avg_hours_per_employee > 12
                 ]
@@ -4912,7 +5525,7 @@ def create_dashboard():
             st.markdown("---")
             st.subheader("📊 Filtered Results")
 
-            filtered_df = overal_df.copy()
+            filtered_df = overal_df
 
             # Apply date filter if dates are selected
             if selected_dates and len(selected_dates) > 0:
@@ -4988,156 +5601,7 @@ def create_dashboard():
                     "📊 Generate Excel Export", type="primary", use_container_width=True
                 ):
                     try:
-                        output = io.BytesIO()
-
-                        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-                            # Prepare data for export - remove Date_parsed if exists
-                            export_df = filtered_df.copy()
-                            if "Date_parsed" in export_df.columns:
-                                export_df = export_df.drop(columns=["Date_parsed"])
-
-                            # Sheet 1: Overal - Detailed filtered records
-                            export_df.to_excel(writer, sheet_name="Overal", index=False)
-
-                            # Sheet 2: Consolidated - Monthly summary by employee
-                            if (
-                                "EMPLOYEE NAME" in export_df.columns
-                                and "Date" in export_df.columns
-                            ):
-                                # Parse dates to get month
-                                temp_df = export_df.copy()
-                                temp_df["Date_Parsed"] = pd.to_datetime(
-                                    temp_df["Date"], format="%d-%b-%Y", errors="coerce"
-                                )
-                                temp_df["Month"] = temp_df["Date_Parsed"].dt.to_period(
-                                    "M"
-                                )
-
-                                # Build aggregation dictionary
-                                agg_dict = {
-                                    "Date": "count",  # Days worked
-                                }
-
-                                if "No. Hours" in temp_df.columns:
-                                    agg_dict["No. Hours"] = "sum"
-
-                                if "Hrs at 1.5 rate" in temp_df.columns:
-                                    agg_dict["Hrs at 1.5 rate"] = "sum"
-
-                                # Create consolidated summary
-                                consolidated_summary = (
-                                    temp_df.groupby(["EMPLOYEE NAME", "Month"])
-                                    .agg(agg_dict)
-                                    .reset_index()
-                                )
-
-                                # Rename columns appropriately
-                                col_rename = {
-                                    "EMPLOYEE NAME": "EMPLOYEE NAME",
-                                    "Month": "Month",
-                                    "Date": "Days Worked",
-                                }
-
-                                if "No. Hours" in agg_dict:
-                                    col_rename["No. Hours"] = "Total Hours"
-
-                                if "Hrs at 1.5 rate" in agg_dict:
-                                    col_rename["Hrs at 1.5 rate"] = "Total OT Hours"
-
-                                consolidated_summary = consolidated_summary.rename(
-                                    columns=col_rename
-                                )
-                                consolidated_summary["Month"] = consolidated_summary[
-                                    "Month"
-                                ].astype(str)
-
-                                # Add SN column
-                                consolidated_summary.insert(
-                                    0, "SN", range(1, len(consolidated_summary) + 1)
-                                )
-
-                                consolidated_summary.to_excel(
-                                    writer, sheet_name="Consolidated", index=False
-                                )
-                            else:
-                                # Fallback: duplicate Overal sheet
-                                export_df.to_excel(
-                                    writer, sheet_name="Consolidated", index=False
-                                )
-
-                            # Add Type of Work dropdown to Overal sheet
-                            from openpyxl.utils import get_column_letter
-                            from openpyxl.worksheet.datavalidation import DataValidation
-
-                            overal_sheet = writer.sheets["Overal"]
-
-                            # Find Type of Work column
-                            try:
-                                type_col_idx = (
-                                    list(export_df.columns).index("Type of Work") + 1
-                                )
-                                col_letter = get_column_letter(type_col_idx)
-
-                                work_types = [
-                                    "Wagon",
-                                    "Superloader",
-                                    "Bulldozer/Superloader",
-                                    "Pump",
-                                    "Miller",
-                                ]
-                                formula_string = '"{}"'.format(",".join(work_types))
-
-                                dv = DataValidation(
-                                    type="list",
-                                    formula1=formula_string,
-                                    showDropDown=False,
-                                    allow_blank=True,
-                                )
-                                dv.error = "Please select from the dropdown: Wagon, Superloader, Bulldozer/Superloader, Pump, or Miller"
-                                dv.errorTitle = "Invalid Entry"
-                                dv.prompt = "Choose work type"
-                                dv.promptTitle = "Type of Work Selection"
-
-                                # Apply to all data rows
-                                start_row = 2
-                                end_row = len(export_df) + 1
-                                range_string = (
-                                    f"{col_letter}{start_row}:{col_letter}{end_row}"
-                                )
-                                dv.add(range_string)
-                                overal_sheet.add_data_validation(dv)
-                            except Exception as e:
-                                st.warning(f"Could not add Type of Work dropdown: {e}")
-
-                            # Sheet 3: Summary - Additional analytics by employee (if requested)
-                            if include_summary:
-                                summary_df = (
-                                    export_df.groupby("EMPLOYEE NAME")
-                                    .agg(
-                                        {
-                                            "SN": "count",
-                                            "Hrs at 1.5 rate": "sum",
-                                            "Date": lambda x: ", ".join(sorted(set(x))),
-                                        }
-                                    )
-                                    .reset_index()
-                                )
-
-                                summary_df.columns = [
-                                    "Employee Name",
-                                    "Number of Shifts",
-                                    "Total OT Hours",
-                                    "Dates Worked",
-                                ]
-                                summary_df.insert(
-                                    0, "SN", range(1, len(summary_df) + 1)
-                                )
-
-                                summary_df.to_excel(
-                                    writer, sheet_name="Summary", index=False
-                                )
-
-                        excel_data = output.getvalue()
+                        excel_data = _build_filtered_excel(filtered_df, include_summary)
 
                         st.success("✅ Excel file generated successfully!")
 
@@ -5313,12 +5777,15 @@ def create_dashboard():
                         st.markdown("---")
 
                         # Top OT earners
+                        import plotly.express as px
+
                         st.markdown("### 🏆 Top 10 Employees by OT Hours (1.5x Rate)")
                         top_employees = (
-                            df_overal.groupby("EMPLOYEE NAME")["Calculated_Hrs_15_Rate"]
+                            df_overal.groupby(
+                                "EMPLOYEE NAME", observed=True, sort=False
+                            )["Calculated_Hrs_15_Rate"]
                             .sum()
-                            .sort_values(ascending=False)
-                            .head(10)
+                            .nlargest(10)
                         )
 
                         fig = px.bar(
@@ -5335,17 +5802,30 @@ def create_dashboard():
 
                         # OT distribution
                         st.markdown("### 📊 OT Hours Distribution")
-                        fig2 = px.histogram(
-                            df_overal[df_overal["Calculated_Hrs_15_Rate"] > 0],
-                            x="Calculated_Hrs_15_Rate",
-                            nbins=20,
-                            labels={
-                                "Calculated_Hrs_15_Rate": "OT Hours (1.5x)",
-                                "count": "Number of Records",
-                            },
+                        # Bin with NumPy and draw plain bars instead of going
+                        # through px.histogram's validation pipeline
+                        import plotly.graph_objects as go
+
+                        ot_values = df_overal["Calculated_Hrs_15_Rate"].to_numpy(
+                            dtype=float
+                        )
+                        bin_counts, bin_edges = np.histogram(
+                            ot_values[ot_values > 0], bins=20
+                        )
+                        fig2 = go.Figure(
+                            go.Bar(
+                                x=(bin_edges[:-1] + bin_edges[1:]) / 2,
+                                y=bin_counts,
+                                width=np.diff(bin_edges),
+                            )
+                        )
+                        fig2.update_layout(
                             title="Distribution of OT Hours",
+                            xaxis_title="OT Hours (1.5x)",
+                            yaxis_title="Number of Records",
+                            bargap=0,
+                            height=350,
                         )
-                        fig2.update_layout(height=350)
                         st.plotly_chart(fig2, use_container_width=True)
 
                     with subtab2:
@@ -5369,7 +5849,7 @@ def create_dashboard():
                             )
 
                         # Apply filters
-                        filtered_df = df_overal.copy()
+                        filtered_df = df_overal
 
                         if employee_filter:
                             filtered_df = filtered_df[
@@ -5415,7 +5895,7 @@ def create_dashboard():
                         )
 
                         # Download button for consolidated data
-                        csv = df_consolidated.to_csv(index=False).encode("utf-8")
+                        csv = _build_csv_bytes(df_consolidated)
                         st.download_button(
                             label="📥 Download Consolidated Data (CSV)",
                             data=csv,
@@ -5490,7 +5970,7 @@ def create_dashboard():
                                 "Difference",
                                 "Match",
                             ]
-                        ].copy()
+                        ]
 
                         # Color-code mismatches
                         def highlight_mismatch(row):
@@ -5512,7 +5992,7 @@ def create_dashboard():
 
                     with col1:
                         # Export detailed records
-                        csv_detailed = (
+                        csv_detailed = _build_csv_bytes(
                             df_overal[
                                 [
                                     "SN",
@@ -5525,8 +6005,6 @@ def create_dashboard():
                                     "Calculated_Hrs_15_Rate",
                                 ]
                             ]
-                            .to_csv(index=False)
-                            .encode("utf-8")
                         )
 
                         st.download_button(
@@ -5538,9 +6016,7 @@ def create_dashboard():
 
                     with col2:
                         # Export consolidated
-                        csv_consolidated = df_consolidated.to_csv(index=False).encode(
-                            "utf-8"
-                        )
+                        csv_consolidated = _build_csv_bytes(df_consolidated)
 
                         st.download_button(
                             label="📊 Export Consolidated (CSV)",
@@ -5551,19 +6027,13 @@ def create_dashboard():
 
                     with col3:
                         # Export to Excel with all sheets
-                        output = io.BytesIO()
-                        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-                            df_overal.to_excel(
-                                writer, sheet_name="Overal_Updated", index=False
-                            )
-                            df_consolidated.to_excel(
-                                writer, sheet_name="Consolidated_New", index=False
-                            )
-                            comparison.to_excel(
-                                writer, sheet_name="Verification", index=False
-                            )
-
-                        excel_data = output.getvalue()
+                        excel_data = _build_excel_bytes(
+                            {
+                                "Overal_Updated": df_overal,
+                                "Consolidated_New": df_consolidated,
+                                "Verification": comparison,
+                            }
+                        )
 
                         st.download_button(
                             label="📊 Export Full Report (Excel)",